@@ -1,44 +1,179 @@
-from flask import Flask, request
-from twilio.twiml.messaging_response import MessagingResponse
-import pandas as pd
+from flask import Flask, request, send_from_directory, url_for
+import hashlib
+import hmac
+import importlib
+import json
 import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime, timedelta, timezone
 from functools import lru_cache
 
+import dypcet_charts
+import dypcet_i18n
+import dypcet_numeric
+import dypcet_reminders
+import dypcet_templates
+
+class LazyModule:
+    """Defer importing a heavy module until one of its attributes is used"""
+    
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+class LRUDict(OrderedDict):
+    """Thread-safe dict bounded to maxsize entries, evicting the least recently used"""
+    
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+        self.lock = threading.RLock()
+    
+    def __getitem__(self, key):
+        with self.lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+    
+    def get(self, key, default=None):
+        with self.lock:
+            if key in self:
+                return self[key]
+            return default
+    
+    def __setitem__(self, key, value):
+        with self.lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
+# pandas and twilio dominate cold-start time, so they are imported during warm-up
+pd = LazyModule('pandas')
+twiml = LazyModule('twilio.twiml.messaging_response')
+
+# Per-file load diagnostics are only printed when explicitly requested
+CSV_LOAD_VERBOSE = os.environ.get('CSV_LOAD_VERBOSE', '0') == '1'
+
+# Time budget for answering a webhook request (Twilio times out after 15 seconds)
+REQUEST_DEADLINE_SECONDS = float(os.environ.get('REQUEST_DEADLINE_SECONDS', '10'))
+REPLY_WORKERS = int(os.environ.get('REPLY_WORKERS', '8'))
+
+# Per-sender token bucket: a burst of RATE_LIMIT_BURST messages, refilled at RATE_LIMIT_PER_MINUTE
+RATE_LIMIT_BURST = float(os.environ.get('RATE_LIMIT_BURST', '5'))
+RATE_LIMIT_PER_MINUTE = float(os.environ.get('RATE_LIMIT_PER_MINUTE', '20'))
+RATE_LIMIT_SENDERS = int(os.environ.get('RATE_LIMIT_SENDERS', '100000'))
+# Webhook requests handled at once; the excess is shed with a canned reply
+MAX_CONCURRENT_REQUESTS = int(os.environ.get('MAX_CONCURRENT_REQUESTS', str(REPLY_WORKERS * 2)))
+# Reply jobs queued or running at once, including ones still finishing after their deadline
+MAX_PENDING_REPLIES = int(os.environ.get('MAX_PENDING_REPLIES', str(REPLY_WORKERS * 2)))
+
+# Twilio REST credentials, used to send replies that finish after the deadline
+TWILIO_ACCOUNT_SID = os.environ.get('TWILIO_ACCOUNT_SID', '')
+TWILIO_AUTH_TOKEN = os.environ.get('TWILIO_AUTH_TOKEN', '')
+TWILIO_WHATSAPP_FROM = os.environ.get('TWILIO_WHATSAPP_FROM', '')
+# 'twilio', or 'local' to print and record outbound messages instead of sending them
+OUTBOUND_CLIENT = os.environ.get('OUTBOUND_CLIENT', 'twilio')
+
+# Reminder subscriptions journal; the scheduler is opt-in so that exactly one process sends them (REMINDER_SCHEDULER=1)
+REMINDER_JOURNAL = os.environ.get('REMINDER_JOURNAL', 'reminders.jsonl')
+REMINDER_SCHEDULER = os.environ.get('REMINDER_SCHEDULER', '0') == '1'
+REMINDER_SEND_WORKERS = int(os.environ.get('REMINDER_SEND_WORKERS', '4'))
+BUS_REMINDER_LEAD_MINUTES = int(os.environ.get('BUS_REMINDER_LEAD_MINUTES', '15'))
+ADMISSION_REMINDER_LEAD_DAYS = int(os.environ.get('ADMISSION_REMINDER_LEAD_DAYS', '3'))
+ADMISSION_REMINDER_HOUR = 9
+# Times and dates in the CSV files are local (IST)
+LOCAL_TIMEZONE = timezone(timedelta(minutes=int(os.environ.get('LOCAL_UTC_OFFSET_MINUTES', '330'))))
+
+# Placement chart images are rendered during warm-up into this directory
+CHART_CACHE_DIR = os.environ.get('CHART_CACHE_DIR', 'chart_cache')
+CHART_MAX_AGE = 365 * 24 * 3600
+# Public URL of this server, used to build media URLs (defaults to the request host)
+PUBLIC_BASE_URL = os.environ.get('PUBLIC_BASE_URL', '').rstrip('/')
+
+# Admin data API is disabled unless ADMIN_TOKEN is set
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN', '')
+ADMIN_PAGE_SIZE = 50
+ADMIN_MAX_PAGE_SIZE = 500
+# Tables derived from the others by dypcet_extractor.py, not editable through the admin API
+READ_ONLY_TABLES = ('complete_data',)
+# Seconds between checks for tables edited by another worker
+DATA_CHECK_INTERVAL = float(os.environ.get('DATA_CHECK_INTERVAL', '2'))
+
 app = Flask(__name__)
 
-# Cache CSV data to avoid reading files repeatedly
-@lru_cache(maxsize=None)
+CSV_FILES = {
+    'admission_requirements': 'dypcet_admission_requirements.csv',
+    'bus_routes': 'dypcet_bus_routes.csv',
+    'college_info': 'dypcet_college_info.csv',
+    'complete_data': 'dypcet_complete_data.csv',
+    'courses': 'dypcet_courses.csv',
+    'facilities': 'dypcet_facilities.csv',
+    'faculty_achievements': 'dypcet_faculty_achievements.csv',
+    'placements': 'dypcet_placements.csv',
+    'rankings': 'dypcet_rankings.csv',
+    'recruiters': 'dypcet_recruiters.csv',
+    'specializations': 'dypcet_specializations.csv',
+    'student_achievements': 'dypcet_student_achievements.csv'
+}
+
+# (mtime, size) of each CSV file when its table was loaded, to notice edits by other workers
+DATA_SIGNATURES = {}
+
+def data_file_signature(filename):
+    """(mtime, size) of a data file, or None if it is missing"""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def read_table(key, filename):
+    """Read one CSV file into a table with cleaned column names and typed columns"""
+    df = pd.read_csv(filename)
+    # Clean column names - remove extra spaces and standardize
+    df.columns = df.columns.str.strip()
+    # Typed numeric columns (LPA ranges, fares, departure minutes)
+    return dypcet_numeric.add_numeric_columns(key, df)
+
+_csv_load_lock = threading.Lock()
+
 def load_csv_data():
     """Load all CSV files into memory for faster access"""
+    # Threads that need the data while it is loading wait for that load instead of starting their own
+    with _csv_load_lock:
+        return read_csv_files()
+
+# Cache CSV data to avoid reading files repeatedly
+@lru_cache(maxsize=None)
+def read_csv_files():
+    """Read every CSV file into a dict of tables"""
     data = {}
-    csv_files = {
-        'admission_requirements': 'dypcet_admission_requirements.csv',
-        'bus_routes': 'dypcet_bus_routes.csv',
-        'college_info': 'dypcet_college_info.csv',
-        'complete_data': 'dypcet_complete_data.csv',
-        'courses': 'dypcet_courses.csv',
-        'facilities': 'dypcet_facilities.csv',
-        'faculty_achievements': 'dypcet_faculty_achievements.csv',
-        'placements': 'dypcet_placements.csv',
-        'rankings': 'dypcet_rankings.csv',
-        'recruiters': 'dypcet_recruiters.csv',
-        'specializations': 'dypcet_specializations.csv',
-        'student_achievements': 'dypcet_student_achievements.csv'
-    }
     
-    for key, filename in csv_files.items():
+    for key, filename in CSV_FILES.items():
         try:
             if os.path.exists(filename):
-                df = pd.read_csv(filename)
-                # Clean column names - remove extra spaces and standardize
-                df.columns = df.columns.str.strip()
+                # Signature first, so a concurrent edit is picked up again rather than missed
+                DATA_SIGNATURES[key] = data_file_signature(filename)
+                df = read_table(key, filename)
                 data[key] = df
-                print(f"✅ Loaded {filename}")
-                print(f"   Columns: {list(df.columns)}")
-                print(f"   Shape: {df.shape}")
-                if not df.empty:
-                    print(f"   Sample data: {df.iloc[0].to_dict()}")
-                print()
+                if CSV_LOAD_VERBOSE:
+                    print(f"✅ Loaded {filename}")
+                    print(f"   Columns: {list(df.columns)}")
+                    print(f"   Shape: {df.shape}")
+                    if not df.empty:
+                        print(f"   Sample data: {df.iloc[0].to_dict()}")
+                    print()
             else:
                 print(f"❌ Warning: {filename} not found")
                 data[key] = pd.DataFrame()
@@ -46,8 +181,53 @@ def load_csv_data():
             print(f"❌ Error loading {filename}: {str(e)}")
             data[key] = pd.DataFrame()
     
+    print(f"✅ Loaded {sum(not df.empty for df in data.values())}/{len(CSV_FILES)} CSV files")
     return data
 
+# Query keyword -> filter tables shared by the reply builders and the reply catalog
+COURSE_LEVEL_KEYWORDS = [
+    ('UG', ['ug', 'undergraduate', 'btech', 'bachelor']),
+    ('PG', ['pg', 'postgraduate', 'mtech', 'master']),
+    ('Ph.D', ['phd', 'doctorate']),
+]
+
+COURSE_LEVEL_NAMES = {'UG': 'Undergraduate (B.Tech/B.Arch)', 'PG': 'Postgraduate (M.Tech)', 'Ph.D': 'Doctorate (Ph.D)'}
+
+SPECIALIZATION_DEPARTMENT_KEYWORDS = [
+    ('Computer Science', ['cse', 'computer']),
+    ('Information Technology', ['it']),
+    ('Mechanical', ['mechanical']),
+    ('Civil', ['civil']),
+    ('Electrical', ['electrical']),
+    ('Electronics', ['electronics']),
+    ('Chemical', ['chemical']),
+    ('Architecture', ['architecture']),
+]
+
+FACILITY_CATEGORY_KEYWORDS = [
+    ('Labs', ['lab']),
+    ('Infrastructure', ['infrastructure']),
+    ('Transportation', ['transport', 'bus']),
+    ('Scholarships', ['scholarship']),
+]
+
+def match_keyword_table(query, table):
+    """Return the first (value, keywords) entry with a keyword in query, else None"""
+    if not query:
+        return None
+    query_lower = query.lower()
+    for value, keywords in table:
+        if any(keyword in query_lower for keyword in keywords):
+            return value, keywords
+    return None
+
+# Reply templates: each reply format is declared once and rendered with a single join
+COURSE_GROUPS = dypcet_templates.Groups(
+    'Level', "🎓 *{group}:*\n",
+    dypcet_templates.Row("   • {Course} ({Type})\n"),
+    order=list(COURSE_LEVEL_NAMES), labels=COURSE_LEVEL_NAMES,
+)
+
 def get_courses_info(query=""):
     """Get courses information based on query"""
     data = load_csv_data()
@@ -56,36 +236,21 @@ def get_courses_info(query=""):
     if courses_df.empty:
         return "📚 Course information is currently unavailable."
     
-    response = "📚 *DYPCET Courses Available:*\n\n"
-    
     # Filter based on query if provided
-    if query:
-        query_lower = query.lower()
-        if 'ug' in query_lower or 'undergraduate' in query_lower or 'btech' in query_lower or 'bachelor' in query_lower:
-            filtered_courses = courses_df[courses_df['Level'] == 'UG']
-        elif 'pg' in query_lower or 'postgraduate' in query_lower or 'mtech' in query_lower or 'master' in query_lower:
-            filtered_courses = courses_df[courses_df['Level'] == 'PG']
-        elif 'phd' in query_lower or 'doctorate' in query_lower:
-            filtered_courses = courses_df[courses_df['Level'] == 'Ph.D']
-        else:
-            filtered_courses = courses_df
-    else:
-        filtered_courses = courses_df
-    
-    # Group by level
-    for level in ['UG', 'PG', 'Ph.D']:
-        level_courses = filtered_courses[filtered_courses['Level'] == level]
-        if not level_courses.empty:
-            level_name = {'UG': 'Undergraduate (B.Tech/B.Arch)', 'PG': 'Postgraduate (M.Tech)', 'Ph.D': 'Doctorate (Ph.D)'}
-            response += f"🎓 *{level_name[level]}:*\n"
-            
-            for _, course in level_courses.iterrows():
-                course_name = course['Course']
-                course_type = course['Type']
-                response += f"   • {course_name} ({course_type})\n"
-            response += "\n"
-    
-    return response
+    level = match_keyword_table(query, COURSE_LEVEL_KEYWORDS)
+    if level:
+        courses_df = courses_df[courses_df['Level'] == level[0]]
+    
+    return dypcet_templates.render(
+        "📚 *DYPCET Courses Available:*\n\n",
+        (COURSE_GROUPS, courses_df),
+    )
+
+SPECIALIZATION_GROUPS = dypcet_templates.Groups(
+    'Department', "🏛️ *{group}:*\n",
+    dypcet_templates.Row("   • {Specialization}\n"),
+    order='sorted',
+)
 
 def get_specializations_info(query=""):
     """Get specializations information"""
@@ -95,44 +260,21 @@ def get_specializations_info(query=""):
     if spec_df.empty:
         return "🔬 Specialization information is currently unavailable."
     
-    response = "🔬 *DYPCET Specializations:*\n\n"
-    
     # Filter by department if specified
-    if query:
-        query_lower = query.lower()
-        dept_keywords = {
-            'cse': 'Computer Science',
-            'computer': 'Computer Science',
-            'it': 'Information Technology',
-            'mechanical': 'Mechanical',
-            'civil': 'Civil',
-            'electrical': 'Electrical',
-            'electronics': 'Electronics',
-            'chemical': 'Chemical',
-            'architecture': 'Architecture'
-        }
-        
-        filtered_spec = spec_df
-        for keyword, dept in dept_keywords.items():
-            if keyword in query_lower:
-                filtered_spec = spec_df[spec_df['Department'].str.contains(dept, case=False, na=False)]
-                break
-    else:
-        filtered_spec = spec_df
-    
-    # Group by department
-    departments = filtered_spec['Department'].unique()
-    for dept in sorted(departments):
-        if pd.notna(dept) and str(dept).strip():
-            dept_specs = filtered_spec[filtered_spec['Department'] == dept]
-            response += f"🏛️ *{dept}:*\n"
-            for _, spec in dept_specs.iterrows():
-                spec_name = spec['Specialization']
-                if pd.notna(spec_name) and str(spec_name).strip():
-                    response += f"   • {spec_name}\n"
-            response += "\n"
-    
-    return response
+    dept = match_keyword_table(query, SPECIALIZATION_DEPARTMENT_KEYWORDS)
+    if dept:
+        spec_df = spec_df[spec_df['Department'].str.contains(dept[0], case=False, na=False)]
+    
+    return dypcet_templates.render(
+        "🔬 *DYPCET Specializations:*\n\n",
+        (SPECIALIZATION_GROUPS, spec_df),
+    )
+
+FACILITY_GROUPS = dypcet_templates.Groups(
+    'Category', "🔹 *{group}:*\n",
+    dypcet_templates.Row("   • *{Facility}*\n", "     {Details}\n"),
+    order='sorted',
+)
 
 def get_facilities_info(query=""):
     """Get facilities information"""
@@ -142,40 +284,38 @@ def get_facilities_info(query=""):
     if facilities_df.empty:
         return "🏢 Facilities information is currently unavailable."
     
-    response = "🏢 *DYPCET Facilities:*\n\n"
-    
     # Filter based on query
-    if query:
-        query_lower = query.lower()
-        if 'lab' in query_lower:
-            filtered_facilities = facilities_df[facilities_df['Category'] == 'Labs']
-        elif 'infrastructure' in query_lower:
-            filtered_facilities = facilities_df[facilities_df['Category'] == 'Infrastructure']
-        elif 'transport' in query_lower or 'bus' in query_lower:
-            filtered_facilities = facilities_df[facilities_df['Category'] == 'Transportation']
-        elif 'scholarship' in query_lower:
-            filtered_facilities = facilities_df[facilities_df['Category'] == 'Scholarships']
-        else:
-            filtered_facilities = facilities_df
-    else:
-        filtered_facilities = facilities_df
-    
-    # Group by category
-    categories = filtered_facilities['Category'].unique()
-    for category in sorted(categories):
-        if pd.notna(category) and str(category).strip():
-            cat_facilities = filtered_facilities[filtered_facilities['Category'] == category]
-            response += f"🔹 *{category}:*\n"
-            for _, facility in cat_facilities.iterrows():
-                facility_name = facility['Facility']
-                details = facility['Details']
-                if pd.notna(facility_name) and str(facility_name).strip():
-                    response += f"   • *{facility_name}*\n"
-                    if pd.notna(details) and str(details).strip():
-                        response += f"     {details}\n"
-            response += "\n"
-    
-    return response
+    category = match_keyword_table(query, FACILITY_CATEGORY_KEYWORDS)
+    if category:
+        facilities_df = facilities_df[facilities_df['Category'] == category[0]]
+    
+    return dypcet_templates.render(
+        "🏢 *DYPCET Facilities:*\n\n",
+        (FACILITY_GROUPS, facilities_df),
+    )
+
+# Key placement metrics, in reply order
+PLACEMENT_KEY_METRICS = [
+    ('Highest Package', '💰'),
+    ('Average Package', '📊'),
+    ('Job Offers 2023-24', '🎯'),
+    ('Campus Placement Drives', '🏢'),
+    ('Students Participated', '👨‍🎓'),
+]
+INTERNSHIP_METRICS = ['Internship Students', 'Paid Internship', 'Final Year Internship']
+PACKAGE_METRICS = ['Top 13 Packages', 'Top 19 Packages', 'Top 230 Packages', 'Top 289 Packages']
+
+PLACEMENT_METRIC_ROW = dypcet_templates.Row(
+    "{emoji} *{Metric}:* {Value}\n",
+    dypcet_templates.Line("   {Details}\n", unless_equal=('Details', 'Value')),
+    "\n",
+)
+PLACEMENT_DETAIL_ROW = dypcet_templates.Row("   • {Details}: {Value}\n")
+RECRUITER_ROW = dypcet_templates.Row(
+    dypcet_templates.Line("   • *{Company}* - {Package}", required=('Company',)),
+    dypcet_templates.Line(" ({Selected_Students})", skip_values=('Multiple',)),
+    "\n",
+)
 
 def get_placement_info():
     """Get placement statistics"""
@@ -186,63 +326,74 @@ def get_placement_info():
     if placements_df.empty:
         return "💼 Placement information is currently unavailable."
     
-    response = "💼 *DYPCET Placement Statistics (2023-24):*\n\n"
-    
-    # Key placement metrics
-    key_metrics = [
-        ('Highest Package', '💰'),
-        ('Average Package', '📊'),
-        ('Job Offers 2023-24', '🎯'),
-        ('Campus Placement Drives', '🏢'),
-        ('Students Participated', '👨‍🎓'),
-    ]
+    # First row of each metric
+    metrics = {}
+    for row in dypcet_templates.table_rows(placements_df, PLACEMENT_METRIC_ROW.fields):
+        metrics.setdefault(row['Metric'], row)
+    recruiters = dypcet_templates.table_rows(recruiters_df, RECRUITER_ROW.fields)
+    
+    return dypcet_templates.render(
+        "💼 *DYPCET Placement Statistics (2023-24):*\n\n",
+        (PLACEMENT_METRIC_ROW, [dict(metrics[m], emoji=emoji) for m, emoji in PLACEMENT_KEY_METRICS if m in metrics]),
+        "🎓 *Internship Programs:*\n",
+        (PLACEMENT_DETAIL_ROW, [metrics[m] for m in INTERNSHIP_METRICS if m in metrics]),
+        "\n",
+        "💵 *Package Distribution:*\n",
+        (PLACEMENT_DETAIL_ROW, [metrics[m] for m in PACKAGE_METRICS if m in metrics]),
+        "\n",
+        "🏢 *Top Recruiters:*\n" if recruiters else "",
+        (RECRUITER_ROW, recruiters),
+    )
+
+# Chart filenames per data snapshot, filled by warm-up so requests never render
+PLACEMENT_CHARTS = {}
+
+CHART_KEYWORDS = ['chart', 'graph']
+
+def prerender_placement_charts():
+    """Render the placement charts for the current data snapshot into the chart cache"""
+    snapshot = get_data_snapshot()
+    if snapshot in PLACEMENT_CHARTS:
+        return PLACEMENT_CHARTS[snapshot]
+    if not dypcet_charts.charts_available():
+        print("❌ Warning: matplotlib not installed, placement charts disabled")
+        PLACEMENT_CHARTS[snapshot] = []
+        return []
     
-    for metric, emoji in key_metrics:
-        metric_data = placements_df[placements_df['Metric'] == metric]
-        if not metric_data.empty:
-            value = metric_data.iloc[0]['Value']
-            details = metric_data.iloc[0]['Details']
-            response += f"{emoji} *{metric}:* {value}\n"
-            if pd.notna(details) and str(details).strip() and details != value:
-                response += f"   {details}\n"
-            response += "\n"
-    
-    # Internship information
-    response += "🎓 *Internship Programs:*\n"
-    internship_metrics = ['Internship Students', 'Paid Internship', 'Final Year Internship']
-    for metric in internship_metrics:
-        metric_data = placements_df[placements_df['Metric'] == metric]
-        if not metric_data.empty:
-            value = metric_data.iloc[0]['Value']
-            details = metric_data.iloc[0]['Details']
-            response += f"   • {details}: {value}\n"
-    response += "\n"
-    
-    # Package distribution
-    response += "💵 *Package Distribution:*\n"
-    package_metrics = ['Top 13 Packages', 'Top 19 Packages', 'Top 230 Packages', 'Top 289 Packages']
-    for metric in package_metrics:
-        metric_data = placements_df[placements_df['Metric'] == metric]
-        if not metric_data.empty:
-            value = metric_data.iloc[0]['Value']
-            details = metric_data.iloc[0]['Details']
-            response += f"   • {details}: {value}\n"
-    response += "\n"
-    
-    # Add recruiters if available
+    data = load_csv_data()
+    specs = []
+    placements_df = data.get('placements', pd.DataFrame())
+    recruiters_df = data.get('recruiters', pd.DataFrame())
+    if not placements_df.empty:
+        specs.append(dypcet_charts.package_distribution_spec(placements_df))
     if not recruiters_df.empty:
-        response += "🏢 *Top Recruiters:*\n"
-        for _, recruiter in recruiters_df.iterrows():
-            company = recruiter['Company']
-            package = recruiter['Package']
-            students = recruiter['Selected_Students']
-            if pd.notna(company):
-                response += f"   • *{company}* - {package}"
-                if pd.notna(students) and students != 'Multiple':
-                    response += f" ({students})"
-                response += "\n"
+        specs.append(dypcet_charts.recruiter_packages_spec(recruiters_df))
     
-    return response
+    PLACEMENT_CHARTS[snapshot] = [
+        dypcet_charts.ensure_chart(CHART_CACHE_DIR, spec)
+        for spec in specs if spec['values']
+    ]
+    return PLACEMENT_CHARTS[snapshot]
+
+def chart_url(filename):
+    """Public URL of a cached chart image"""
+    if PUBLIC_BASE_URL:
+        return f"{PUBLIC_BASE_URL}/charts/{filename}"
+    return url_for('chart_image', filename=filename, _external=True)
+
+def get_reply_charts(intent, normalized):
+    """Cached chart filenames to attach to a reply (placement charts when asked for)"""
+    if intent != 'placements' or not any(keyword in normalized.text for keyword in CHART_KEYWORDS):
+        return []
+    return PLACEMENT_CHARTS.get(get_data_snapshot(), [])
+
+COLLEGE_GROUPS = dypcet_templates.Groups(
+    'Category', "📌 *{group}:*\n",
+    dypcet_templates.Row(
+        "   • *{Field}:* {Value}\n",
+        dypcet_templates.Line("     {Details}\n", unless_equal=('Details', 'Value')),
+    ),
+)
 
 def get_college_info():
     """Get basic college information"""
@@ -252,25 +403,23 @@ def get_college_info():
     if college_df.empty:
         return "🏛️ College information is currently unavailable."
     
-    response = "🏛️ *About DYPCET:*\n\n"
-    
-    # Group by category
-    categories = college_df['Category'].unique()
-    for category in categories:
-        if pd.notna(category) and str(category).strip():
-            cat_info = college_df[college_df['Category'] == category]
-            response += f"📌 *{category}:*\n"
-            for _, info in cat_info.iterrows():
-                field = info['Field']
-                value = info['Value']
-                details = info['Details']
-                if pd.notna(field) and pd.notna(value):
-                    response += f"   • *{field}:* {value}\n"
-                    if pd.notna(details) and str(details).strip() and details != value:
-                        response += f"     {details}\n"
-            response += "\n"
-    
-    return response
+    return dypcet_templates.render(
+        "🏛️ *About DYPCET:*\n\n",
+        (COLLEGE_GROUPS, college_df),
+    )
+
+RANKING_ROW = dypcet_templates.Row(
+    "🎖️ *{Ranking_Agency}*\n",
+    "   Category: {Category}\n",
+    "   Rank: {Rank}\n",
+    "   Grade: {Grade}\n",
+    "   CGPA: {CGPA}\n",
+    "   Status: {Status}\n",
+    "   Year: {Year}\n",
+    "   Period: {Period}\n",
+    "   Details: {Details}\n",
+    "\n",
+)
 
 def get_rankings_info():
     """Get college rankings"""
@@ -280,40 +429,115 @@ def get_rankings_info():
     if rankings_df.empty:
         return "🏆 Rankings information is currently unavailable."
     
-    response = "🏆 *DYPCET Rankings & Accreditations:*\n\n"
-    
-    for _, ranking in rankings_df.iterrows():
-        agency = ranking['Ranking_Agency']
-        category = ranking['Category']
-        rank = ranking['Rank']
-        year = ranking['Year']
-        details = ranking['Details']
-        grade = ranking['Grade']
-        cgpa = ranking['CGPA']
-        status = ranking['Status']
-        period = ranking['Period']
-        
-        if pd.notna(agency):
-            response += f"🎖️ *{agency}*\n"
-            if pd.notna(category):
-                response += f"   Category: {category}\n"
-            if pd.notna(rank):
-                response += f"   Rank: {rank}\n"
-            if pd.notna(grade):
-                response += f"   Grade: {grade}\n"
-            if pd.notna(cgpa):
-                response += f"   CGPA: {cgpa}\n"
-            if pd.notna(status):
-                response += f"   Status: {status}\n"
-            if pd.notna(year):
-                response += f"   Year: {year}\n"
-            if pd.notna(period):
-                response += f"   Period: {period}\n"
-            if pd.notna(details):
-                response += f"   Details: {details}\n"
-            response += "\n"
+    return dypcet_templates.render(
+        "🏆 *DYPCET Rankings & Accreditations:*\n\n",
+        (RANKING_ROW, rankings_df),
+    )
+
+# Generic words that follow a village name in stop names ("Rukadi Fata", "Kawala Naka")
+BUS_STOP_SUFFIXES = ('fata', 'phata', 'naka', 'chowk')
+# English words a stop name can shorten to ("Male Fata"), only matched by the full stop name
+COMMON_WORD_STOP_KEYS = {'male', 'main', 'old', 'new', 'city', 'road', 'gate', 'station', 'market', 'college'}
+
+def normalize_stop_name(name):
+    """Normalize a stop or route name for index lookups"""
+    return ' '.join(str(name).lower().replace('.', ' ').split())
+
+def stop_index_keys(stop_name):
+    """Index keys of a stop: its normalized name, and the name without a generic suffix"""
+    key = normalize_stop_name(stop_name)
+    keys = {key}
+    words = key.split()
+    if len(words) > 1 and words[-1] in BUS_STOP_SUFFIXES:
+        short = ' '.join(words[:-1])
+        if short not in COMMON_WORD_STOP_KEYS:
+            keys.add(short)
+    return keys
+
+def route_stop_names(raw_stops):
+    """Intermediate stop names from a route's comma-separated Stops value"""
+    if pd.isna(raw_stops) or str(raw_stops).strip().lower() == 'direct route':
+        return []
+    return [s.strip() for s in str(raw_stops).split(',') if s.strip()]
+
+@lru_cache(maxsize=None)
+def load_bus_stop_index():
+    """Parse bus routes into a stop -> routes inverted index"""
+    data = load_csv_data()
+    bus_df = data.get('bus_routes', pd.DataFrame())
     
-    return response
+    routes = {}
+    stops = {}
+    max_words = 1
+    
+    if bus_df.empty:
+        return {'routes': routes, 'stops': stops, 'spellings': {}, 'max_words': max_words}
+    
+    for route in bus_df.to_dict('records'):
+        route_name = route.get('Route')
+        if pd.isna(route_name) or not str(route_name).strip():
+            continue
+        route_name = str(route_name).strip()
+        
+        raw_stops = route.get('Stops')
+        stop_names = route_stop_names(raw_stops)
+        
+        routes[route_name] = {
+            'route': route_name,
+            'departure_time': route.get('Departure_Time'),
+            'fare': route.get('Fare'),
+            'stops': stop_names,
+            'raw_stops': raw_stops,
+        }
+        
+        # Position 0 is the route's origin, intermediate stops follow in order
+        for position, stop_name in enumerate([route_name] + stop_names):
+            for k in stop_index_keys(stop_name):
+                max_words = max(max_words, len(k.split()))
+                entries = stops.setdefault(k, [])
+                if not any(entry[0] == route_name for entry in entries):
+                    entries.append((route_name, position, stop_name))
+    
+    # Loose spellings, so names transliterated from Devanagari ("sangali") find their stop;
+    # a spelling shared by two stops is ambiguous and left out
+    spellings = {}
+    for k in stops:
+        spellings.setdefault(dypcet_i18n.spelling_key(k), []).append(k)
+    spellings = {spelling: keys[0] for spelling, keys in spellings.items() if len(keys) == 1}
+    
+    return {'routes': routes, 'stops': stops, 'spellings': spellings, 'max_words': max_words}
+
+def find_bus_stops(query):
+    """Return {stop key: [(route, position, stop name), ...]} for stops named in query"""
+    index = load_bus_stop_index()
+    stops = index['stops']
+    if not stops:
+        return {}
+    
+    words = normalize_stop_name(''.join(c if c.isalnum() else ' ' for c in query)).split()
+    matches = {}
+    # Probe every word n-gram up to the longest indexed stop name, longest first
+    covered = set()
+    for size in range(min(index['max_words'], len(words)), 0, -1):
+        for start in range(len(words) - size + 1):
+            span = set(range(start, start + size))
+            if span & covered:
+                continue
+            key = ' '.join(words[start:start + size])
+            if key not in stops:
+                key = index['spellings'].get(dypcet_i18n.spelling_key(key))
+            if key:
+                matches[key] = stops[key]
+                covered |= span
+    return matches
+
+BUS_ROUTE_LINES = (
+    "🚍 *Route: {Route}*\n",
+    "   ⏰ Departure Time: {Departure_Time}\n",
+    "   💰 Monthly Fare: ₹{Fare}\n",
+)
+BUS_ROUTE_ROW = dypcet_templates.Row(*BUS_ROUTE_LINES, "\n")
+BUS_ROUTE_WITH_STOPS_ROW = dypcet_templates.Row(*BUS_ROUTE_LINES, "   🛑 Stops: {Stops}\n", "\n")
 
 def get_bus_routes_info(query=""):
     """Get bus routes information"""
@@ -323,31 +547,49 @@ def get_bus_routes_info(query=""):
     if bus_df.empty:
         return "🚌 Bus routes information is currently unavailable."
     
-    response = "🚌 *DYPCET Bus Routes:*\n\n"
-    
+    # Queries naming a stop or route only get the routes that serve it
     if query:
-        # Filter by route name
-        query_lower = query.lower()
-        filtered_routes = bus_df[bus_df['Route'].str.contains(query_lower, case=False, na=False)]
-        if filtered_routes.empty:
-            filtered_routes = bus_df
-    else:
-        filtered_routes = bus_df
-    
-    for _, route in filtered_routes.iterrows():
-        route_name = route['Route']
-        departure_time = route['Departure_Time']
-        fare = route['Fare']
-        stops = route['Stops']
-        
-        response += f"🚍 *Route: {route_name}*\n"
-        response += f"   ⏰ Departure Time: {departure_time}\n"
-        response += f"   💰 Monthly Fare: ₹{fare}\n"
-        if pd.notna(stops) and str(stops).strip():
-            response += f"   🛑 Stops: {stops}\n"
-        response += "\n"
-    
-    return response
+        stop_matches = find_bus_stops(query)
+        if stop_matches:
+            return format_bus_stop_matches(stop_matches)
+    
+    return dypcet_templates.render(
+        "🚌 *DYPCET Bus Routes:*\n\n",
+        (BUS_ROUTE_WITH_STOPS_ROW, bus_df),
+    )
+
+BUS_STOP_MATCH_ROW = dypcet_templates.Row(
+    "🚍 *Route: {Route}* {stop}\n",
+    *BUS_ROUTE_LINES[1:],
+    "   🛑 Stops: {Stops}\n",
+    "\n",
+)
+
+def format_bus_stop_matches(stop_matches):
+    """Format the routes serving each matched stop"""
+    routes = load_bus_stop_index()['routes']
+    rows = []
+    for entries in stop_matches.values():
+        for route_name, position, stop_name in entries:
+            route = routes[route_name]
+            if position == 0:
+                stop = f"(starts at {stop_name})"
+            else:
+                stop = f"- stop {position}/{len(route['stops'])} ({stop_name})"
+            rows.append({
+                'Route': route_name,
+                'stop': stop,
+                'Departure_Time': route['departure_time'],
+                'Fare': route['fare'],
+                'Stops': ', '.join(route['stops']),
+            })
+    
+    return dypcet_templates.render("🚌 *DYPCET Buses for your stop:*\n\n", (BUS_STOP_MATCH_ROW, rows))
+
+ADMISSION_GROUPS = dypcet_templates.Groups(
+    'Category', "📋 *{group}:*\n",
+    dypcet_templates.Row(dypcet_templates.Line("   • *{Requirement}:* {Details}\n", required=('Requirement',))),
+)
 
 def get_admission_requirements():
     """Get admission requirements"""
@@ -357,22 +599,15 @@ def get_admission_requirements():
     if admission_df.empty:
         return "📝 Admission requirements information is currently unavailable."
     
-    response = "📝 *DYPCET Admission Requirements:*\n\n"
-    
-    # Group by category
-    categories = admission_df['Category'].unique()
-    for category in categories:
-        if pd.notna(category) and str(category).strip():
-            cat_reqs = admission_df[admission_df['Category'] == category]
-            response += f"📋 *{category}:*\n"
-            for _, req in cat_reqs.iterrows():
-                requirement = req['Requirement']
-                details = req['Details']
-                if pd.notna(requirement):
-                    response += f"   • *{requirement}:* {details}\n"
-            response += "\n"
-    
-    return response
+    return dypcet_templates.render(
+        "📝 *DYPCET Admission Requirements:*\n\n",
+        (ADMISSION_GROUPS, admission_df),
+    )
+
+FACULTY_GROUPS = dypcet_templates.Groups(
+    'Category', "🏆 *{group}:*\n",
+    dypcet_templates.Row("   • {Metric}: {Value}\n"),
+)
 
 def get_faculty_achievements():
     """Get faculty achievements"""
@@ -382,22 +617,15 @@ def get_faculty_achievements():
     if faculty_df.empty:
         return "👨‍🏫 Faculty achievements information is currently unavailable."
     
-    response = "👨‍🏫 *DYPCET Faculty Achievements:*\n\n"
-    
-    # Group by category
-    categories = faculty_df['Category'].unique()
-    for category in categories:
-        if pd.notna(category) and str(category).strip():
-            cat_achievements = faculty_df[faculty_df['Category'] == category]
-            response += f"🏆 *{category}:*\n"
-            for _, achievement in cat_achievements.iterrows():
-                metric = achievement['Metric']
-                value = achievement['Value']
-                if pd.notna(metric) and pd.notna(value):
-                    response += f"   • {metric}: {value}\n"
-            response += "\n"
-    
-    return response
+    return dypcet_templates.render(
+        "👨‍🏫 *DYPCET Faculty Achievements:*\n\n",
+        (FACULTY_GROUPS, faculty_df),
+    )
+
+STUDENT_GROUPS = dypcet_templates.Groups(
+    'Category', "🥇 *{group}:*\n",
+    dypcet_templates.Row("   • *{Achievement}*\n", "     Student: {Student}\n", "     Year: {Year}\n"),
+)
 
 def get_student_achievements():
     """Get student achievements"""
@@ -407,97 +635,217 @@ def get_student_achievements():
     if student_df.empty:
         return "🏅 Student achievements information is currently unavailable."
     
-    response = "🏅 *DYPCET Student Achievements:*\n\n"
-    
-    # Group by category
-    categories = student_df['Category'].unique()
-    for category in categories:
-        if pd.notna(category) and str(category).strip():
-            cat_achievements = student_df[student_df['Category'] == category]
-            response += f"🥇 *{category}:*\n"
-            for _, achievement in cat_achievements.iterrows():
-                achievement_name = achievement['Achievement']
-                student = achievement['Student']
-                year = achievement['Year']
-                if pd.notna(achievement_name):
-                    response += f"   • *{achievement_name}*\n"
-                    response += f"     Student: {student}\n"
-                    if pd.notna(year):
-                        response += f"     Year: {year}\n"
-            response += "\n"
-    
-    return response
+    return dypcet_templates.render(
+        "🏅 *DYPCET Student Achievements:*\n\n",
+        (STUDENT_GROUPS, student_df),
+    )
 
-def process_whatsapp_message(message):
-    """Process incoming WhatsApp message and return appropriate response"""
-    message_lower = message.lower().strip()
-    
-    # Course-related queries
-    if any(keyword in message_lower for keyword in ['course', 'program', 'degree', 'study', 'ug', 'pg', 'undergraduate', 'postgraduate', 'btech', 'mtech']):
-        return get_courses_info(message_lower)
-    
-    # Specialization queries
-    elif any(keyword in message_lower for keyword in ['specialization', 'branch', 'department', 'cse', 'mechanical', 'civil', 'electrical', 'computer science', 'electronics']):
-        return get_specializations_info(message_lower)
-    
-    # Facilities queries
-    elif any(keyword in message_lower for keyword in ['facility', 'facilities', 'lab', 'library', 'hostel', 'infrastructure', 'campus']):
-        return get_facilities_info(message_lower)
-    
-    # Placement queries
-    elif any(keyword in message_lower for keyword in ['placement', 'job', 'recruit', 'company', 'package', 'salary', 'career']):
-        return get_placement_info()
-    
-    # College info queries
-    elif any(keyword in message_lower for keyword in ['about', 'college', 'institute', 'information', 'dypcet', 'history']):
-        return get_college_info()
-    
-    # Rankings queries
-    elif any(keyword in message_lower for keyword in ['ranking', 'rank', 'naac', 'nba', 'accreditation', 'grade']):
-        return get_rankings_info()
-    
-    # Bus routes queries
-    elif any(keyword in message_lower for keyword in ['bus', 'transport', 'route', 'travel', 'fare']):
-        return get_bus_routes_info(message_lower)
+@lru_cache(maxsize=None)
+def load_numeric_indexes():
+    """Build sorted indexes over the typed package, fare and departure columns"""
+    data = load_csv_data()
+    recruiters = data.get('recruiters', pd.DataFrame())
+    bus_routes = data.get('bus_routes', pd.DataFrame())
+    recruiter_rows = recruiters.to_dict('records')
+    bus_rows = bus_routes.to_dict('records')
+    return {
+        'recruiter_package_min': dypcet_numeric.SortedIndex((r.get('Package_Min_LPA'), r) for r in recruiter_rows),
+        'recruiter_package_max': dypcet_numeric.SortedIndex((r.get('Package_Max_LPA'), r) for r in recruiter_rows),
+        'bus_fare': dypcet_numeric.SortedIndex((r.get('Fare_Amount'), r) for r in bus_rows),
+        'bus_departure': dypcet_numeric.SortedIndex((r.get('Departure_Minutes'), r) for r in bus_rows),
+    }
+
+# 'lakh' alone is not package context ("income certificate less than 8 lakh")
+PACKAGE_CONTEXT_KEYWORDS = ['lpa', 'package', 'salary', 'compan', 'recruit']
+BUS_CONTEXT_KEYWORDS = ['bus', 'fare', 'route', 'transport', 'depart', 'leave']
+# Intents whose keywords outrank a numeric comparison in the same message
+FILTER_OVERRIDING_INTENTS = ('admission', 'faculty', 'students')
+
+THOUSANDS_SEPARATOR_PATTERN = re.compile(r'(?<=\d),(?=\d)')
+COMPARISON_PATTERN = re.compile(
+    r'(above|over|more than|greater than|at least|below|under|less than|at most|up to|upto|before|after)'
+    r'\s*(?:rs\.?|₹)?\s*(\d+(?:[.:]\d+)?)\s*(am|pm)?'
+)
+TOP_K_PATTERN = re.compile(r'top\s*(\d+)')
+BUS_SUPERLATIVES = [
+    ('cheapest', ['cheapest', 'lowest fare', 'least fare']),
+    ('costliest', ['costliest', 'most expensive', 'highest fare']),
+    ('earliest', ['earliest', 'first bus']),
+    ('latest', ['last bus', 'latest departure']),
+]
+# "latest" alone usually asks for current information ("latest bus routes"), so it needs a count
+LATEST_COUNT_PATTERN = re.compile(r'latest\s*(\d+)')
+ABOVE_WORDS = ('above', 'over', 'more than', 'greater than', 'at least', 'after')
+
+def comparison_text(normalized, context_keywords):
+    """Message text for numeric parsing ('15,000' -> '15000'), or '' when it is not a comparison query"""
+    text = normalized.text
+    if not any(keyword in text for keyword in context_keywords):
+        return ''
+    for intent, keywords in INTENT_KEYWORDS:
+        if intent in FILTER_OVERRIDING_INTENTS and any(keyword in text for keyword in keywords):
+            return ''
+    return THOUSANDS_SEPARATOR_PATTERN.sub('', text)
+
+def parse_package_query(normalized):
+    """Canonical package comparison ('above:6', 'below:5', 'top:3') in a message, or ''"""
+    text = comparison_text(normalized, PACKAGE_CONTEXT_KEYWORDS)
+    if not text:
+        return ''
+    match = COMPARISON_PATTERN.search(text)
+    if match and ':' not in match.group(2) and not match.group(3):
+        op = 'above' if match.group(1) in ABOVE_WORDS else 'below'
+        return f"{op}:{dypcet_numeric.format_number(float(match.group(2)))}"
+    match = TOP_K_PATTERN.search(text)
+    if match:
+        return f"top:{int(match.group(1))}"
+    if 'highest paying' in text or 'best paying' in text:
+        return 'top:3'
+    return ''
+
+def parse_bus_query(normalized):
+    """Canonical bus time/fare comparison ('before:465', 'fare_below:15000', 'cheapest:1') or ''"""
+    text = comparison_text(normalized, BUS_CONTEXT_KEYWORDS)
+    if not text:
+        return ''
+    match = COMPARISON_PATTERN.search(text)
+    if match:
+        word, number, meridiem = match.groups()
+        above = word in ABOVE_WORDS
+        if word in ('before', 'after') or ':' in number or '.' in number or meridiem:
+            minutes = dypcet_numeric.parse_time_minutes(f"{number} {meridiem or ''}")
+            if minutes is not None:
+                return f"{'after' if above else 'before'}:{minutes}"
+        else:
+            return f"{'fare_above' if above else 'fare_below'}:{int(float(number))}"
+    for op, phrases in BUS_SUPERLATIVES:
+        for phrase in phrases:
+            if phrase in text:
+                count = re.search(re.escape(phrase) + r'\s*(\d+)', text)
+                return f"{op}:{int(count.group(1)) if count else 1}"
+    count = LATEST_COUNT_PATTERN.search(text)
+    if count:
+        return f"latest:{int(count.group(1))}"
+    return ''
+
+RECRUITER_PACKAGE_ROW = dypcet_templates.Row("   • *{Company}* - {Package}\n")
+
+def get_recruiters_by_package(variant):
+    """Recruiters filtered or ranked by package, from the sorted package indexes"""
+    op, _, amount = variant.partition(':')
+    indexes = load_numeric_indexes()
+    
+    if op == 'above':
+        recruiters = indexes['recruiter_package_max'].range(low=float(amount), include_low=False)[::-1]
+        response = f"💼 *Recruiters (package > {amount} LPA):*\n\n"
+    elif op == 'below':
+        recruiters = indexes['recruiter_package_min'].range(high=float(amount), include_high=False)
+        response = f"💼 *Recruiters (package < {amount} LPA):*\n\n"
+    else:
+        recruiters = indexes['recruiter_package_max'].largest(int(amount))
+        response = "💼 *Top recruiters by package:*\n\n"
     
-    # Admission queries
-    elif any(keyword in message_lower for keyword in ['admission', 'eligibility', 'requirement', 'document', 'apply', 'entrance']):
-        return get_admission_requirements()
+    if not recruiters:
+        return "💼 No recruiters match that package range."
     
-    # Faculty queries
-    elif any(keyword in message_lower for keyword in ['faculty', 'teacher', 'professor', 'staff', 'research', 'phd']):
-        return get_faculty_achievements()
+    return dypcet_templates.render(response, (RECRUITER_PACKAGE_ROW, recruiters))
+
+def get_buses_by_value(variant):
+    """Bus routes filtered or ranked by departure time or fare, from the sorted indexes"""
+    op, _, amount = variant.partition(':')
+    indexes = load_numeric_indexes()
+    amount = int(amount)
+    
+    if op == 'before':
+        routes = indexes['bus_departure'].range(high=amount, include_high=False)
+        response = f"🚌 *Buses (departure < {dypcet_numeric.format_minutes(amount)}):*\n\n"
+    elif op == 'after':
+        routes = indexes['bus_departure'].range(low=amount, include_low=False)
+        response = f"🚌 *Buses (departure > {dypcet_numeric.format_minutes(amount)}):*\n\n"
+    elif op == 'fare_below':
+        routes = indexes['bus_fare'].range(high=amount, include_high=False)
+        response = f"🚌 *Buses (monthly fare < ₹{amount}):*\n\n"
+    elif op == 'fare_above':
+        routes = indexes['bus_fare'].range(low=amount, include_low=False)[::-1]
+        response = f"🚌 *Buses (monthly fare > ₹{amount}):*\n\n"
+    elif op == 'cheapest':
+        routes = indexes['bus_fare'].smallest(amount)
+        response = "🚌 *Cheapest buses:*\n\n"
+    elif op == 'costliest':
+        routes = indexes['bus_fare'].largest(amount)
+        response = "🚌 *Costliest buses:*\n\n"
+    elif op == 'earliest':
+        routes = indexes['bus_departure'].smallest(amount)
+        response = "🚌 *Earliest buses:*\n\n"
+    else:
+        routes = indexes['bus_departure'].largest(amount)
+        response = "🚌 *Latest buses:*\n\n"
     
-    # Student achievement queries
-    elif any(keyword in message_lower for keyword in ['student achievement', 'student success', 'award', 'competition', 'sports', 'cultural']):
-        return get_student_achievements()
+    if not routes:
+        return "🚌 No buses match that time or fare."
     
-    # Greeting
-    elif any(keyword in message_lower for keyword in ['hi', 'hello', 'hey', 'good morning', 'good afternoon', 'good evening', 'start', 'help']):
-        return """👋 *Welcome to DYPCET Information Bot!*
+    return dypcet_templates.render(response, (BUS_ROUTE_ROW, routes))
 
-I can help you with information about:
-🎓 Courses & Programs (UG, PG, Ph.D)
-🔬 Specializations by Department
-🏢 Facilities & Infrastructure
-💼 Placements & Career
-🏛️ College Information
-🏆 Rankings & Accreditations
-🚌 Bus Routes & Transport
-📝 Admission Requirements
-👨‍🏫 Faculty Achievements
-🏅 Student Achievements
-
-Just ask me anything about DYPCET! For example:
+def match_bus_stop_query(normalized):
+    """Bus stops or villages named in a message, joined as the reply variant"""
+    return ' '.join(find_bus_stops(normalized.search_text))
+
+# Numbered quick-reply menu topics, in menu order (reply "1" for Courses, ...)
+MENU_TOPICS = [
+    ('courses', '🎓', 'Courses & Programs (UG, PG, Ph.D)'),
+    ('specializations', '🔬', 'Specializations by Department'),
+    ('facilities', '🏢', 'Facilities & Infrastructure'),
+    ('placements', '💼', 'Placements & Career'),
+    ('college', '🏛️', 'College Information'),
+    ('rankings', '🏆', 'Rankings & Accreditations'),
+    ('bus_routes', '🚌', 'Bus Routes & Transport'),
+    ('admission', '📝', 'Admission Requirements'),
+    ('faculty', '👨‍🏫', 'Faculty Achievements'),
+    ('students', '🏅', 'Student Achievements'),
+]
+
+GREETING_HEADER = """👋 *Welcome to DYPCET Information Bot!*
+
+I can help you with information about:"""
+
+GREETING_FOOTER = """Reply with a number (e.g. *1* for Courses, *1.2* for PG courses) or just ask me anything about DYPCET! For example:
 • "Tell me about courses"
 • "What are the facilities?"
 • "Placement statistics"
 • "Bus routes from Sangli"
-• "Computer science specializations"""
-    
-    # Default response for unrecognized queries
-    else:
-        return """❓ I understand you're asking about: *"{message}"*
+• "Computer science specializations\""""
+
+def build_greeting(language='en'):
+    """Greeting with the numbered topic menu"""
+    header = dypcet_i18n.localize_reply(GREETING_HEADER, language, 'greeting_header')
+    footer = dypcet_i18n.localize_reply(GREETING_FOOTER, language, 'greeting_footer')
+    lines = [
+        f"*{number}* {emoji} {dypcet_i18n.menu_label(label, language)}"
+        for number, (_, emoji, label) in enumerate(MENU_TOPICS, 1)
+    ]
+    return header + '\n' + '\n'.join(lines) + '\n\n' + footer
+
+GREETING_REPLY = build_greeting()
+
+FALLBACK_REPLY = "⏳ Sorry, I'm taking longer than usual. Please send your question again in a minute."
+
+DEFERRED_REPLY = "⏳ Looking that up for you, I'll send the details in a moment."
+
+THROTTLED_REPLY = "✋ You're sending messages too quickly. Please wait a moment and try again."
+
+BUSY_REPLY = "⏳ I'm getting a lot of questions right now. Please ask again in a minute."
+
+REMINDER_REPLIES = {
+    'reminder_bus_set': "✅ I'll remind you {lead} minutes before the {routes} bus leaves, every day. Send *stop reminders* to cancel.",
+    'reminder_admission_set': "✅ I'll remind you {days} days before, and on the day of: {deadlines}. Send *stop reminders* to cancel.",
+    'reminder_none': "📅 There are no upcoming admission deadlines to remind you about right now.",
+    'reminder_help': "⏰ I can send you reminders. Try *remind me Kagal bus* or *remind me admission deadlines*.",
+    'reminder_stopped': "✅ Your reminders have been cancelled.",
+    'reminder_bus': "⏰ *Reminder:* the {route} bus leaves at {time}, in {lead} minutes.",
+    'reminder_admission': "⏰ *Reminder:* {requirement} - {details} (deadline {date}).",
+}
+
+DEFAULT_REPLY = """❓ I'm not sure what you're asking about.
 
 I can help you with information about:
 • *Courses* - UG/PG/PhD programs
@@ -513,9 +861,574 @@ I can help you with information about:
 
 Please try asking about any of these topics! 😊"""
 
+# Router keywords, checked in order; the first intent with a matching keyword wins.
+# A callable instead of a keyword list matches when it returns a non-empty variant.
+INTENT_KEYWORDS = [
+    # Numeric comparisons ("companies above 6 LPA", "buses before 7:45")
+    ('recruiter_filter', parse_package_query),
+    ('bus_filter', parse_bus_query),
+    ('courses', ['course', 'program', 'degree', 'study', 'ug', 'pg', 'undergraduate', 'postgraduate', 'btech', 'mtech']),
+    ('specializations', ['specialization', 'branch', 'department', 'cse', 'mechanical', 'civil', 'electrical', 'computer science', 'electronics']),
+    ('facilities', ['facility', 'facilities', 'lab', 'library', 'hostel', 'infrastructure', 'campus']),
+    ('placements', ['placement', 'job', 'recruit', 'company', 'package', 'salary', 'career']),
+    ('college', ['about', 'college', 'institute', 'information', 'dypcet', 'history']),
+    ('rankings', ['ranking', 'rank', 'naac', 'nba', 'accreditation', 'grade']),
+    ('bus_routes', ['bus', 'transport', 'route', 'travel', 'fare']),
+    ('admission', ['admission', 'eligibility', 'requirement', 'document', 'certificate', 'apply', 'entrance']),
+    ('faculty', ['faculty', 'teacher', 'professor', 'staff', 'research', 'phd']),
+    ('students', ['student achievement', 'student success', 'award', 'competition', 'sports', 'cultural']),
+    # Messages that only name a bus stop or village ("Uchgaon?"), after every keyword intent
+    ('bus_routes', match_bus_stop_query),
+    ('greeting', ['hi', 'hello', 'hey', 'good morning', 'good afternoon', 'good evening', 'start', 'help']),
+]
+
+REPLY_BUILDERS = {
+    'courses': get_courses_info,
+    'specializations': get_specializations_info,
+    'facilities': get_facilities_info,
+    'placements': lambda query: get_placement_info(),
+    'college': lambda query: get_college_info(),
+    'rankings': lambda query: get_rankings_info(),
+    'bus_routes': get_bus_routes_info,
+    'admission': lambda query: get_admission_requirements(),
+    'faculty': lambda query: get_faculty_achievements(),
+    'students': lambda query: get_student_achievements(),
+    'greeting': lambda query: GREETING_REPLY,
+    'default': lambda query: DEFAULT_REPLY,
+    'recruiter_filter': get_recruiters_by_package,
+    'bus_filter': get_buses_by_value,
+}
+
+# Tables each intent's reply is built from, used to re-render only replies touched by an edit
+REPLY_TABLES = {
+    'courses': ('courses',),
+    'specializations': ('specializations',),
+    'facilities': ('facilities',),
+    'placements': ('placements', 'recruiters'),
+    'college': ('college_info',),
+    'rankings': ('rankings',),
+    'bus_routes': ('bus_routes',),
+    'admission': ('admission_requirements',),
+    'faculty': ('faculty_achievements',),
+    'students': ('student_achievements',),
+    'recruiter_filter': ('recruiters',),
+    'bus_filter': ('bus_routes',),
+}
+
+# Intents whose reply depends on the query, and the table that picks the variant
+VARIANT_KEYWORD_TABLES = {
+    'courses': COURSE_LEVEL_KEYWORDS,
+    'specializations': SPECIALIZATION_DEPARTMENT_KEYWORDS,
+    'facilities': FACILITY_CATEGORY_KEYWORDS,
+}
+
+# Intents whose variant is parsed from the message
+VARIANT_PARSERS = {
+    'bus_routes': match_bus_stop_query,
+    'recruiter_filter': parse_package_query,
+    'bus_filter': parse_bus_query,
+}
+OPEN_VARIANT_INTENTS = ('recruiter_filter', 'bus_filter')
+
+# Reply language per sender: (language, set explicitly by a language command)
+SENDER_LANGUAGES = LRUDict(maxsize=100000)
+
+def keyword_intent(normalized):
+    """First intent whose keyword list matches, without the data-backed matchers, or None"""
+    text = normalized.text
+    for intent, keywords in INTENT_KEYWORDS:
+        if not callable(keywords) and any(keyword in text for keyword in keywords):
+            return intent
+    return None
+
+def classify_message(normalized):
+    """Return the (intent, variant) a normalized message should be answered with"""
+    text = normalized.text
+    for intent, keywords in INTENT_KEYWORDS:
+        if callable(keywords):
+            matched = bool(keywords(normalized))
+        else:
+            matched = any(keyword in text for keyword in keywords)
+        if matched:
+            return intent, reply_variant(intent, normalized)
+    return 'default', ''
+
+def reply_variant(intent, normalized):
+    """Canonical query selecting which variant of an intent's reply to send"""
+    if intent in VARIANT_KEYWORD_TABLES:
+        match = match_keyword_table(normalized.text, VARIANT_KEYWORD_TABLES[intent])
+        return match[1][0] if match else ''
+    if intent in VARIANT_PARSERS:
+        return VARIANT_PARSERS[intent](normalized)
+    return ''
+
+def reply_variants():
+    """Every (intent, variant) pair that can be compiled ahead of time"""
+    for intent in REPLY_BUILDERS:
+        # Numeric comparisons have open-ended variants and are rendered on demand
+        if intent in OPEN_VARIANT_INTENTS:
+            continue
+        yield intent, ''
+        for _, keywords in VARIANT_KEYWORD_TABLES.get(intent, []):
+            yield intent, keywords[0]
+    for stop in load_bus_stop_index()['stops']:
+        yield 'bus_routes', stop
+
+def reply_uses_row(intent, variant, row):
+    """True if the reply for (intent, variant) can show this row of one of its tables"""
+    if not variant:
+        return True
+    if intent == 'courses':
+        level = match_keyword_table(variant, COURSE_LEVEL_KEYWORDS)
+        return level is None or row.get('Level') == level[0]
+    if intent == 'specializations':
+        dept = match_keyword_table(variant, SPECIALIZATION_DEPARTMENT_KEYWORDS)
+        return dept is None or dept[0].lower() in str(row.get('Department', '')).lower()
+    if intent == 'facilities':
+        category = match_keyword_table(variant, FACILITY_CATEGORY_KEYWORDS)
+        return category is None or row.get('Category') == category[0]
+    if intent == 'bus_routes':
+        stop_names = [row.get('Route', '')] + route_stop_names(row.get('Stops'))
+        return any(variant in stop_index_keys(name) for name in stop_names)
+    return True
+
+def render_reply(language, intent, variant):
+    """Render one reply in the given language"""
+    if intent == 'greeting':
+        return build_greeting(language)
+    return dypcet_i18n.localize_reply(REPLY_BUILDERS[intent](variant), language, intent)
+
+@lru_cache(maxsize=None)
+def compile_reply_catalog():
+    """Pre-render every reply variant in every supported language"""
+    return {
+        (language, intent, variant): render_reply(language, intent, variant)
+        for language in dypcet_i18n.SUPPORTED_LANGUAGES
+        for intent, variant in reply_variants()
+    }
+
+@lru_cache(maxsize=1024)
+def render_uncompiled_reply(language, intent, variant):
+    """Render and memoize variants outside the catalog (e.g. several bus stops at once)"""
+    return render_reply(language, intent, variant)
+
+# Last reply sent for each (language, intent, variant), served when a request misses its deadline
+LAST_GOOD_REPLIES = LRUDict(maxsize=4096)
+
+def get_reply(language, intent, variant):
+    """Look up a compiled reply, rendering it only if it was not pre-compiled"""
+    reply = compile_reply_catalog().get((language, intent, variant))
+    if reply is None:
+        reply = render_uncompiled_reply(language, intent, variant)
+    LAST_GOOD_REPLIES[(language, intent, variant)] = reply
+    return reply
+
+def resolve_language(sender, normalized):
+    """Pick the reply language from the message and the sender's preference"""
+    preference = SENDER_LANGUAGES.get(sender) if sender else None
+    if preference and preference[1]:
+        return preference[0]
+    if normalized.language:
+        if sender:
+            SENDER_LANGUAGES[sender] = (normalized.language, False)
+        return normalized.language
+    if preference:
+        return preference[0]
+    return dypcet_i18n.DEFAULT_LANGUAGE
+
+def menu_sub_options(intent):
+    """Sub-menu entries of a topic as (label, intent, variant), derived from the data"""
+    data = load_csv_data()
+    if intent == 'courses':
+        levels = set(data.get('courses', pd.DataFrame()).get('Level', []))
+        return [(COURSE_LEVEL_NAMES[level], 'courses', keywords[0])
+                for level, keywords in COURSE_LEVEL_KEYWORDS if level in levels]
+    if intent == 'specializations':
+        departments = data.get('specializations', pd.DataFrame()).get('Department', pd.Series(dtype=str))
+        return [(dept, 'specializations', keywords[0])
+                for dept, keywords in SPECIALIZATION_DEPARTMENT_KEYWORDS
+                if departments.str.contains(dept, case=False, na=False).any()]
+    if intent == 'facilities':
+        categories = set(data.get('facilities', pd.DataFrame()).get('Category', []))
+        return [(category, 'facilities', keywords[0])
+                for category, keywords in FACILITY_CATEGORY_KEYWORDS if category in categories]
+    if intent == 'placements':
+        return [('Top recruiters by package', 'recruiter_filter', 'top:5')]
+    if intent == 'bus_routes':
+        return [(route, 'bus_routes', normalize_stop_name(route)) for route in load_bus_stop_index()['routes']]
+    return []
+
+def menu_footer(code, options, language):
+    """Footer listing a topic's sub-menu codes"""
+    lines = [f"👉 {dypcet_i18n.menu_label('Reply with a number for more:', language)}"]
+    for number, (label, _, _) in enumerate(options, 1):
+        lines.append(f"*{code}.{number}* {dypcet_i18n.menu_label(label, language)}")
+    lines.append(f"*0* {dypcet_i18n.menu_label('Main menu', language)}")
+    return '\n'.join(lines)
+
+@lru_cache(maxsize=None)
+def compile_menu():
+    """Dispatch table from (language, menu code) to a pre-rendered reply"""
+    entries = {'0': ('greeting', '', [])}
+    for number, (intent, _, _) in enumerate(MENU_TOPICS, 1):
+        code = str(number)
+        options = menu_sub_options(intent)
+        entries[code] = (intent, '', options)
+        for sub, (_, sub_intent, variant) in enumerate(options, 1):
+            entries[f"{code}.{sub}"] = (sub_intent, variant, [])
+    
+    replies = {}
+    for language in dypcet_i18n.SUPPORTED_LANGUAGES:
+        for code, (intent, variant, options) in entries.items():
+            reply = get_reply(language, intent, variant)
+            if options:
+                reply = reply.rstrip('\n') + '\n\n' + menu_footer(code, options, language)
+            replies[(language, code)] = reply
+    return replies
+
+MENU_CODE_PATTERN = re.compile(r'\d+(?:\.\d+)?$')
+
+def preferred_language(sender):
+    """The sender's remembered reply language, or the default"""
+    preference = SENDER_LANGUAGES.get(sender) if sender else None
+    return preference[0] if preference else dypcet_i18n.DEFAULT_LANGUAGE
+
+def process_whatsapp_message(message, sender=None, state=None):
+    """Process incoming WhatsApp message and return appropriate response
+    
+    If a state dict is given, the chosen reply key is recorded in it before any
+    data is loaded, so a caller that gives up waiting knows the intent, and the
+    chart filenames to attach to the reply are recorded under 'charts'.
+    """
+    state = {} if state is None else state
+    state['charts'] = []
+    
+    # Numbered quick replies ("1", "1.2", "७.३") skip text parsing entirely
+    code = dypcet_i18n.menu_code(message)
+    if MENU_CODE_PATTERN.match(code):
+        language = preferred_language(sender)
+        state['reply_key'] = (language, 'menu', code)
+        reply = compile_menu().get((language, code))
+        if reply is not None:
+            LAST_GOOD_REPLIES[state['reply_key']] = reply
+            return reply
+    
+    # Explicit language switch ("marathi", "हिंदी", "english")
+    language = dypcet_i18n.language_command(message)
+    if language:
+        if sender:
+            SENDER_LANGUAGES[sender] = (language, True)
+        return dypcet_i18n.LOCALIZED_REPLIES[language]['language_set']
+    
+    normalized = dypcet_i18n.normalize_message(message)
+    language = resolve_language(sender, normalized)
+    # Reminder subscriptions are per sender, so they never come from the reply catalog
+    if sender and is_reminder_command(normalized):
+        state['reply_key'] = (language, 'reminder', '')
+        return reminder_command(normalized, sender, language)
+    
+    # Classifying can wait on the data for the stop index, so the likely intent is noted first
+    state['intent'] = keyword_intent(normalized)
+    intent, variant = classify_message(normalized)
+    state['reply_key'] = (language, intent, variant)
+    reply = get_reply(language, intent, variant)
+    state['charts'] = get_reply_charts(intent, normalized)
+    return reply
+
+class TwilioOutboundClient:
+    """Send WhatsApp messages outside a webhook response via the Twilio REST API"""
+    
+    def __init__(self, account_sid, auth_token, from_number):
+        self.account_sid = account_sid
+        self.auth_token = auth_token
+        self.from_number = from_number
+        self._client = None
+    
+    def send(self, to, body, media_urls=None):
+        if self._client is None:
+            from twilio.rest import Client
+            self._client = Client(self.account_sid, self.auth_token)
+        return self._client.messages.create(
+            from_=self.from_number, to=to, body=body, media_url=media_urls or None,
+        )
+
+class LocalOutboundClient:
+    """Print and record outbound messages instead of sending them, for local testing"""
+    
+    def __init__(self, maxlen=1000):
+        self.sent = deque(maxlen=maxlen)
+    
+    def send(self, to, body, media_urls=None):
+        self.sent.append((to, body, media_urls))
+        print(f"📤 To {to}: {body[:100]}")
+
+@lru_cache(maxsize=None)
+def get_outbound_client():
+    """Outbound client from OUTBOUND_CLIENT and TWILIO_* settings, or None when not configured"""
+    if OUTBOUND_CLIENT == 'local':
+        return LocalOutboundClient()
+    if TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN and TWILIO_WHATSAPP_FROM:
+        return TwilioOutboundClient(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, TWILIO_WHATSAPP_FROM)
+    return None
+
+_reply_executor = ThreadPoolExecutor(max_workers=REPLY_WORKERS, thread_name_prefix='reply')
+_reply_slots = threading.BoundedSemaphore(MAX_PENDING_REPLIES)
+DEADLINE_EXCEEDED = Counter()
+_metrics_lock = threading.Lock()
+
+REJECTED_REQUESTS = Counter()
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# sender -> (tokens, last refill time, throttle notice sent)
+SENDER_BUCKETS = LRUDict(RATE_LIMIT_SENDERS)
+
+def take_sender_token(sender, now=None):
+    """Spend one of the sender's tokens; returns (allowed, notify) where notify is set on the first refusal"""
+    now = time.monotonic() if now is None else now
+    with SENDER_BUCKETS.lock:
+        tokens, updated, notified = SENDER_BUCKETS.get(sender, (RATE_LIMIT_BURST, now, False))
+        tokens = min(RATE_LIMIT_BURST, tokens + (now - updated) * RATE_LIMIT_PER_MINUTE / 60)
+        if tokens >= 1:
+            SENDER_BUCKETS[sender] = (tokens - 1, now, False)
+            return True, False
+        SENDER_BUCKETS[sender] = (tokens, now, True)
+        return False, not notified
+
+def count_rejected(reason):
+    """Count a webhook request that was throttled or shed"""
+    with _metrics_lock:
+        REJECTED_REQUESTS[reason] += 1
+
+def canned_twiml(reply, sender, intent):
+    """TwiML for a fixed reply in the sender's language (no message when reply is None)"""
+    resp = twiml.MessagingResponse()
+    if reply is not None:
+        resp.message(dypcet_i18n.localize_reply(reply, preferred_language(sender), intent))
+    return str(resp)
+
+def send_deferred_reply(future, sender):
+    """Send a reply that finished after its webhook deadline as a separate message"""
+    try:
+        get_outbound_client().send(sender, future.result())
+    except Exception as e:
+        print(f"ERROR sending deferred reply to {sender}: {str(e)}")
+
+def process_with_deadline(message, sender, deadline):
+    """Build the reply and its chart filenames within the deadline, falling back to a cached or ack reply"""
+    state = {}
+    # While the pool is backed up (e.g. stalled on a data load), answer without queueing more work
+    if not _reply_slots.acquire(blocking=False):
+        count_rejected('reply_queue_full')
+        return dypcet_i18n.localize_reply(FALLBACK_REPLY, preferred_language(sender), 'fallback'), []
+    future = _reply_executor.submit(process_whatsapp_message, message, sender, state)
+    future.add_done_callback(lambda f: _reply_slots.release())
+    try:
+        reply = future.result(timeout=max(deadline - time.monotonic(), 0))
+        return reply, state['charts']
+    except FutureTimeoutError:
+        pass
+    
+    reply_key = state.get('reply_key')
+    intent = reply_key[1] if reply_key else state.get('intent') or 'unclassified'
+    with _metrics_lock:
+        DEADLINE_EXCEEDED[intent] += 1
+    print(f"Deadline exceeded for intent '{intent}'")
+    
+    # Prefer the last reply sent for the same question, even if the data has since changed (charts are skipped)
+    cached = LAST_GOOD_REPLIES.get(reply_key) if reply_key else None
+    if cached:
+        # Nobody will use the late reply, so a job that has not started yet is dropped
+        future.cancel()
+        return cached, []
+    
+    language = reply_key[0] if reply_key else resolve_language(sender, dypcet_i18n.normalize_message(message))
+    if sender and get_outbound_client():
+        future.add_done_callback(lambda f: send_deferred_reply(f, sender))
+        return dypcet_i18n.localize_reply(DEFERRED_REPLY, language, 'deferred'), []
+    future.cancel()
+    return dypcet_i18n.localize_reply(FALLBACK_REPLY, language, 'fallback'), []
+
+# Reminders: "remind me Kagal bus" / "remind me admission deadlines", scheduled by dypcet_reminders
+REMINDER_KEYWORDS = ['remind']
+# Only explicit cancel phrases, so "remind me to stop at uchgaon" still subscribes
+REMINDER_STOP_PATTERN = re.compile(
+    r'^(?:stop|cancel|unsubscribe)\W*$'
+    r'|\b(?:stop|cancel|end)\s+(?:all\s+|my\s+|the\s+)?reminders?\b'
+    r'|\breminders?\s+(?:off|stop)\b'
+    r'|\bunsubscribe\b'
+)
+ADMISSION_REMINDER_KEYWORDS = ['admission', 'deadline', 'document']
+REMINDER_SENDS = Counter()
+_reminder_executor = ThreadPoolExecutor(max_workers=REMINDER_SEND_WORKERS, thread_name_prefix='reminder')
+
+def reminder_reply(name, language, **values):
+    """A reminder reply or message in the given language"""
+    return dypcet_i18n.localize_reply(REMINDER_REPLIES[name], language, name).format(**values)
+
+@lru_cache(maxsize=None)
+def admission_deadlines():
+    """{requirement: (details, deadline date)} for admission rows whose details give a date"""
+    df = load_csv_data().get('admission_requirements', pd.DataFrame())
+    deadlines = {}
+    for row in dypcet_templates.table_rows(df, ['Requirement', 'Details']):
+        deadline = dypcet_numeric.parse_date(row.get('Details'))
+        if deadline and not dypcet_numeric.is_missing(row.get('Requirement')):
+            deadlines[row['Requirement']] = (row['Details'], deadline)
+    return deadlines
+
+def local_timestamp(day, minutes):
+    """Unix time of a number of minutes after local midnight on a date"""
+    midnight = datetime(day.year, day.month, day.day, tzinfo=LOCAL_TIMEZONE)
+    return int(midnight.timestamp()) + minutes * 60
+
+def next_reminder_due(reminder, after):
+    """Unix time of a reminder's next delivery after `after`, or None when it has none left"""
+    today = datetime.fromtimestamp(after, LOCAL_TIMEZONE).date()
+    if reminder['kind'] == 'bus':
+        # Every day, lead minutes before the route's departure time
+        route = load_bus_stop_index()['routes'].get(reminder['key'])
+        departure = dypcet_numeric.parse_time_minutes(route['departure_time']) if route else None
+        if departure is None:
+            return None
+        candidates = [local_timestamp(today + timedelta(days=days), departure - reminder['lead']) for days in (0, 1, 2)]
+    else:
+        # Lead days before the deadline, and on the day itself
+        deadline = admission_deadlines().get(reminder['key'])
+        if deadline is None:
+            return None
+        morning = ADMISSION_REMINDER_HOUR * 60
+        candidates = [
+            local_timestamp(deadline[1] - timedelta(days=reminder['lead']), morning),
+            local_timestamp(deadline[1], morning),
+        ]
+    return next((due for due in candidates if due > after), None)
+
+def reminder_message(reminder):
+    """Message text for a due reminder"""
+    if reminder['kind'] == 'bus':
+        route = load_bus_stop_index()['routes'][reminder['key']]
+        return reminder_reply('reminder_bus', reminder['language'],
+                              route=reminder['key'], time=route['departure_time'], lead=reminder['lead'])
+    details, deadline = admission_deadlines()[reminder['key']]
+    return reminder_reply('reminder_admission', reminder['language'],
+                          requirement=reminder['key'], details=details, date=deadline.strftime('%d %b %Y'))
+
+def send_reminder(client, to, body):
+    """Send one reminder message, counting the outcome"""
+    try:
+        client.send(to, body)
+        outcome = 'sent'
+    except Exception as e:
+        print(f"ERROR sending reminder to {to}: {str(e)}")
+        outcome = 'failed'
+    with _metrics_lock:
+        REMINDER_SENDS[outcome] += 1
+
+def deliver_reminders(reminders):
+    """Send a batch of reminders that fell due together, rendering each distinct message once"""
+    client = get_outbound_client()
+    if client is None:
+        print(f"❌ Warning: {len(reminders)} reminders due but no outbound client is configured")
+        return
+    messages = {}
+    sends = []
+    for reminder in reminders:
+        key = (reminder['kind'], reminder['key'], reminder['language'])
+        if key not in messages:
+            messages[key] = reminder_message(reminder)
+        sends.append((reminder['sender'], messages[key]))
+    # Wait for the whole batch so batches never overlap
+    list(_reminder_executor.map(lambda send: send_reminder(client, *send), sends))
+
+REMINDERS = dypcet_reminders.ReminderScheduler(REMINDER_JOURNAL, next_reminder_due, deliver_reminders)
+
+def make_reminder(sender, kind, key, lead, language):
+    """A reminder subscription record"""
+    return {'id': f"{kind}:{key}:{sender}", 'sender': sender, 'kind': kind, 'key': key, 'lead': lead, 'language': language}
+
+def is_reminder_stop(normalized):
+    """True if a message asks to cancel reminders ("stop reminders", "आठवण बंद")"""
+    text = normalized.text
+    return bool(REMINDER_STOP_PATTERN.search(text) or dypcet_i18n.LOCALIZED_REMINDER_STOP.search(text))
+
+def is_reminder_command(normalized):
+    """True if a message asks to subscribe to or cancel reminders"""
+    return any(keyword in normalized.text for keyword in REMINDER_KEYWORDS) or is_reminder_stop(normalized)
+
+def reminder_command(normalized, sender, language):
+    """Handle a reminder (un)subscription and return the reply"""
+    text = normalized.text
+    if is_reminder_stop(normalized):
+        REMINDERS.remove_sender(sender)
+        return reminder_reply('reminder_stopped', language)
+    
+    if any(keyword in text for keyword in ADMISSION_REMINDER_KEYWORDS):
+        now = time.time()
+        subscribed = []
+        for requirement in admission_deadlines():
+            reminder = make_reminder(sender, 'admission', requirement, ADMISSION_REMINDER_LEAD_DAYS, language)
+            if next_reminder_due(reminder, now) is not None:
+                REMINDERS.add(reminder)
+                subscribed.append(requirement)
+        if not subscribed:
+            return reminder_reply('reminder_none', language)
+        return reminder_reply('reminder_admission_set', language,
+                              deadlines=', '.join(subscribed), days=ADMISSION_REMINDER_LEAD_DAYS)
+    
+    # Every route serving the named stops ("remind me Kagal bus", "remind me Uchgaon")
+    stop_matches = find_bus_stops(normalized.search_text)
+    routes = list(dict.fromkeys(route for entries in stop_matches.values() for route, _, _ in entries))
+    if not routes:
+        return reminder_reply('reminder_help', language)
+    for route in routes:
+        REMINDERS.add(make_reminder(sender, 'bus', route, BUS_REMINDER_LEAD_MINUTES, language))
+    return reminder_reply('reminder_bus_set', language, routes=', '.join(routes), lead=BUS_REMINDER_LEAD_MINUTES)
+
+def start_reminders():
+    """Start the reminder scheduler in this process unless it runs elsewhere"""
+    if REMINDER_SCHEDULER:
+        REMINDERS.start()
+
+def twilio_signature_valid():
+    """Whether the webhook request was signed by Twilio with TWILIO_AUTH_TOKEN"""
+    # Without the token no Twilio outbound client exists either, so unsigned local testing stays possible
+    if not TWILIO_AUTH_TOKEN:
+        return True
+    from twilio.request_validator import RequestValidator
+    # Twilio signs the public URL, which differs from request.url behind a proxy
+    url = request.url
+    if PUBLIC_BASE_URL:
+        url = PUBLIC_BASE_URL + request.full_path.rstrip('?')
+    signature = request.headers.get('X-Twilio-Signature', '')
+    return RequestValidator(TWILIO_AUTH_TOKEN).validate(url, request.form, signature)
+
 @app.route('/whatsapp', methods=['POST'])
 def whatsapp_webhook():
     """Handle incoming WhatsApp messages"""
+    deadline = time.monotonic() + REQUEST_DEADLINE_SECONDS
+    # From is only trusted when Twilio signed the request; reminders and deferred replies are sent to it
+    if not twilio_signature_valid():
+        count_rejected('bad_signature')
+        return {'status': 'error', 'error': 'Invalid Twilio signature'}, 403
+    sender = request.values.get('From', '')
+    
+    # Shed load before doing any work when every slot is busy
+    if not _request_slots.acquire(blocking=False):
+        count_rejected('shed')
+        return canned_twiml(BUSY_REPLY, sender, 'busy')
+    try:
+        # Only the first refused message of a burst gets a reply, the rest are dropped silently
+        if sender:
+            allowed, notify = take_sender_token(sender)
+            if not allowed:
+                count_rejected('throttled')
+                return canned_twiml(THROTTLED_REPLY if notify else None, sender, 'throttled')
+        return handle_whatsapp_message(sender, deadline)
+    finally:
+        _request_slots.release()
+
+def handle_whatsapp_message(sender, deadline):
+    """Answer one admitted WhatsApp message"""
     try:
         # Debug: Print all incoming data
         print("=== INCOMING WEBHOOK DATA ===")
@@ -526,24 +1439,25 @@ def whatsapp_webhook():
         
         # Get the message from the request
         incoming_msg = request.values.get('Body', '').strip()
-        sender = request.values.get('From', '')
         
         print(f"Incoming message: '{incoming_msg}'")
         print(f"From: {sender}")
         
         if not incoming_msg:
             print("Warning: No message body received")
-            resp = MessagingResponse()
+            resp = twiml.MessagingResponse()
             resp.message("I didn't receive your message. Please try again.")
             return str(resp)
         
-        # Process the message and get response
-        response_text = process_whatsapp_message(incoming_msg)
+        # Process the message and get response, within Twilio's response deadline
+        response_text, charts = process_with_deadline(incoming_msg, sender, deadline)
         print(f"Response: {response_text[:100]}...")  # Print first 100 chars
         
         # Create Twilio response
-        resp = MessagingResponse()
-        resp.message(response_text)
+        resp = twiml.MessagingResponse()
+        reply = resp.message(response_text)
+        for filename in charts:
+            reply.media(chart_url(filename))
         
         print("=== SENDING RESPONSE ===")
         print(str(resp))
@@ -556,7 +1470,7 @@ def whatsapp_webhook():
         import traceback
         traceback.print_exc()
         
-        resp = MessagingResponse()
+        resp = twiml.MessagingResponse()
         resp.message("Sorry, I encountered an error. Please try again later.")
         return str(resp)
 
@@ -588,37 +1502,395 @@ def home():
         <p><strong>Status:</strong> Webhook is ready to receive messages!</p>
         """
 
-@app.route('/debug-csv')
-def debug_csv():
-    """Debug endpoint to check CSV data"""
+@lru_cache(maxsize=None)
+def get_data_snapshot():
+    """Content hash identifying the currently loaded CSV data"""
+    digest = hashlib.sha1()
+    for key, filename in sorted(CSV_FILES.items()):
+        digest.update(key.encode())
+        if os.path.exists(filename):
+            with open(filename, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+def check_admin_token():
+    """Return an error response unless the request carries the admin token"""
+    if not ADMIN_TOKEN:
+        return {'status': 'error', 'error': 'Admin API is disabled'}, 403
+    token = request.headers.get('X-Admin-Token', '')
+    auth_header = request.headers.get('Authorization', '')
+    if auth_header.startswith('Bearer '):
+        token = auth_header[len('Bearer '):]
+    if not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+        return {'status': 'error', 'error': 'Invalid admin token'}, 401
+    return None
+
+def cached_json_response(etag, render):
+    """Serve a JSON body by ETag, only calling render() on a cache miss"""
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(render(), mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+@lru_cache(maxsize=32)
+def render_admin_tables(snapshot):
+    """Render the admin table listing for a data snapshot"""
     data = load_csv_data()
-    result = "<h1>CSV Debug Information</h1>"
+    tables = {
+        key: {'rows': len(df), 'columns': list(df.columns)}
+        for key, df in data.items()
+    }
+    return json.dumps({'snapshot': snapshot, 'tables': tables}, ensure_ascii=False)
+
+@lru_cache(maxsize=256)
+def render_admin_table(snapshot, table, offset, limit, columns):
+    """Render one page of a table as JSON for a data snapshot"""
+    df = load_csv_data()[table]
+    if columns:
+        df = df[list(columns)]
+    page = df.iloc[offset:offset + limit]
+    rows = json.loads(page.to_json(orient='records', force_ascii=False))
+    return json.dumps({
+        'snapshot': snapshot,
+        'table': table,
+        'offset': offset,
+        'limit': limit,
+        'total': len(df),
+        'columns': list(df.columns),
+        'rows': rows,
+    }, ensure_ascii=False)
+
+# Live edits: admin changes are written to the CSV files and applied to the loaded tables in place
+_publish_lock = threading.RLock()
+_data_watcher_thread = None
+
+# Structures built from a table, rebuilt lazily after it changes
+DERIVED_CACHES = {
+    'bus_routes': (load_bus_stop_index, load_numeric_indexes),
+    'recruiters': (load_numeric_indexes,),
+    'admission_requirements': (admission_deadlines,),
+}
+
+def read_raw_rows(filename):
+    """Rows of a CSV file as unparsed strings, so untouched rows are written back unchanged"""
+    df = pd.read_csv(filename, dtype=str, keep_default_na=False)
+    df.columns = df.columns.str.strip()
+    return df
+
+def write_raw_rows(filename, df):
+    """Atomically replace a CSV file, keeping its line endings"""
+    with open(filename, 'rb') as f:
+        line_ending = '\r\n' if b'\r\n' in f.readline() else '\n'
+    # Write to a temporary file first so readers never see a partial file
+    tmp_path = f"{filename}.{os.getpid()}.tmp"
+    df.to_csv(tmp_path, index=False, lineterminator=line_ending)
+    os.replace(tmp_path, filename)
+
+def changed_rows(old_df, new_df):
+    """Rows present in only one of two versions of a table, as dicts"""
+    if old_df is None or list(old_df.columns) != list(new_df.columns):
+        return None
+    columns = list(old_df.columns)
+    old_rows = Counter(old_df.astype(object).where(old_df.notna(), None).itertuples(index=False, name=None))
+    new_rows = Counter(new_df.astype(object).where(new_df.notna(), None).itertuples(index=False, name=None))
+    return [dict(zip(columns, row)) for row in (old_rows - new_rows) + (new_rows - old_rows)]
+
+def publish_table(table, df, signature):
+    """Swap in a new version of a table and re-render only the replies it affects"""
+    with _publish_lock:
+        data = load_csv_data()
+        rows = changed_rows(data.get(table), df)
+        data[table] = df
+        DATA_SIGNATURES[table] = signature
+        for cached in DERIVED_CACHES.get(table, ()):
+            cached.cache_clear()
+        render_uncompiled_reply.cache_clear()
+        
+        # Stop keys come and go with bus route edits, so the catalog's key set is recomputed too
+        catalog = compile_reply_catalog()
+        keys = {
+            (language, intent, variant)
+            for language in dypcet_i18n.SUPPORTED_LANGUAGES
+            for intent, variant in reply_variants()
+        }
+        stale = [
+            key for key in keys
+            if key not in catalog or (
+                table in REPLY_TABLES.get(key[1], ())
+                and (rows is None or any(reply_uses_row(key[1], key[2], row) for row in rows))
+            )
+        ]
+        # One dict update, so each request sees either the old or the new reply
+        catalog.update({key: render_reply(*key) for key in stale})
+        for key in set(catalog) - keys:
+            catalog.pop(key, None)
+        
+        compile_menu.cache_clear()
+        compile_menu()
+        get_data_snapshot.cache_clear()
+        prerender_placement_charts()
+    print(f"✅ Published {table}: {len(stale)} replies re-rendered")
+    return len(stale)
+
+class RowNotFound(LookupError):
+    """An admin edit addressed a row the table's CSV file no longer has"""
+
+def edit_table(table, edit):
+    """Apply edit(raw rows) -> raw rows to a table's CSV file and publish the result"""
+    filename = CSV_FILES[table]
+    with _publish_lock:
+        raw = edit(read_raw_rows(filename))
+        write_raw_rows(filename, raw)
+        signature = data_file_signature(filename)
+        return publish_table(table, read_table(table, filename), signature)
+
+def sync_changed_tables():
+    """Pick up tables another worker has edited since this worker loaded them"""
+    with _publish_lock:
+        for table, filename in CSV_FILES.items():
+            signature = data_file_signature(filename)
+            if signature and table in DATA_SIGNATURES and signature != DATA_SIGNATURES[table]:
+                publish_table(table, read_table(table, filename), signature)
+
+def watch_changed_tables():
+    """Background loop syncing edited tables, so re-rendering never runs on a request"""
+    while True:
+        time.sleep(DATA_CHECK_INTERVAL)
+        try:
+            sync_changed_tables()
+        except Exception as e:
+            print(f"❌ Error syncing edited tables: {str(e)}")
+
+def start_data_watcher():
+    """Start the edited-table watcher thread (once per process)"""
+    global _data_watcher_thread
+    with _publish_lock:
+        if _data_watcher_thread is None:
+            _data_watcher_thread = threading.Thread(target=watch_changed_tables, name='data-watcher', daemon=True)
+            _data_watcher_thread.start()
+    return _data_watcher_thread
+
+def editable_table(table):
+    """Return an error response unless table can be edited"""
+    if table not in CSV_FILES or not os.path.exists(CSV_FILES[table]):
+        return {'status': 'error', 'error': f'Unknown table: {table}'}, 404
+    if table in READ_ONLY_TABLES:
+        return {'status': 'error', 'error': f'{table} is generated by dypcet_extractor.py and cannot be edited'}, 400
+    return None
+
+def row_values(table, partial):
+    """Validate a JSON row body; returns ({column: string value}, None) or (None, error response)"""
+    row = request.get_json(silent=True)
+    if not isinstance(row, dict) or not row:
+        return None, ({'status': 'error', 'error': 'Body must be a JSON object of column values'}, 400)
+    columns = list(read_raw_rows(CSV_FILES[table]).columns)
+    unknown = [c for c in row if c not in columns]
+    if unknown:
+        return None, ({'status': 'error', 'error': f'Unknown columns: {unknown}'}, 400)
+    values = {c: '' if v is None else str(v) for c, v in row.items()}
+    if not partial:
+        values = {c: values.get(c, '') for c in columns}
+    return values, None
+
+@app.route('/admin/metrics')
+def admin_metrics():
+    """Admin API: request handling counters"""
+    error = check_admin_token()
+    if error:
+        return error
+    with _metrics_lock:
+        return {
+            'deadline_exceeded': dict(DEADLINE_EXCEEDED),
+            'throttled': REJECTED_REQUESTS['throttled'],
+            'shed': REJECTED_REQUESTS['shed'],
+            'reply_queue_full': REJECTED_REQUESTS['reply_queue_full'],
+            'bad_signature': REJECTED_REQUESTS['bad_signature'],
+            'reminders': {'pending': len(REMINDERS), **REMINDER_SENDS},
+        }
+
+@app.route('/admin/data')
+def admin_data_tables():
+    """Admin API: list loaded tables with their shape"""
+    error = check_admin_token()
+    if error:
+        return error
+    snapshot = get_data_snapshot()
+    etag = hashlib.sha1(f"{snapshot}:tables".encode()).hexdigest()
+    return cached_json_response(etag, lambda: render_admin_tables(snapshot))
+
+@app.route('/admin/data/<table>')
+def admin_data_table(table):
+    """Admin API: paginated, column-projected JSON rows of one table"""
+    error = check_admin_token()
+    if error:
+        return error
     
-    for key, df in data.items():
-        result += f"<h2>{key.upper()}</h2>"
-        if df.empty:
-            result += "<p>No data loaded</p>"
-        else:
-            result += f"<p><strong>Shape:</strong> {df.shape}</p>"
-            result += f"<p><strong>Columns:</strong> {list(df.columns)}</p>"
-            result += "<h3>Sample Data:</h3>"
-            result += df.head(3).to_html()
-        result += "<hr>"
+    data = load_csv_data()
+    if table not in data:
+        return {'status': 'error', 'error': f'Unknown table: {table}'}, 404
     
-    return result
+    try:
+        offset = max(int(request.args.get('offset', 0)), 0)
+        limit = min(max(int(request.args.get('limit', ADMIN_PAGE_SIZE)), 1), ADMIN_MAX_PAGE_SIZE)
+    except ValueError:
+        return {'status': 'error', 'error': 'offset and limit must be integers'}, 400
+    
+    # Repeated columns are dropped, so ?columns=Route,Route renders like ?columns=Route
+    columns = tuple(dict.fromkeys(c.strip() for c in request.args.get('columns', '').split(',') if c.strip()))
+    unknown = [c for c in columns if c not in data[table].columns]
+    if unknown:
+        return {'status': 'error', 'error': f'Unknown columns: {unknown}'}, 400
+    
+    snapshot = get_data_snapshot()
+    etag = hashlib.sha1(f"{snapshot}:{table}:{offset}:{limit}:{','.join(columns)}".encode()).hexdigest()
+    return cached_json_response(etag, lambda: render_admin_table(snapshot, table, offset, limit, columns))
+
+@app.route('/admin/data/<table>', methods=['POST'])
+def admin_insert_row(table):
+    """Admin API: append a row to a table"""
+    error = check_admin_token() or editable_table(table)
+    if error:
+        return error
+    values, error = row_values(table, partial=False)
+    if error:
+        return error
+    
+    def insert(raw):
+        return pd.concat([raw, pd.DataFrame([values], columns=raw.columns)], ignore_index=True)
+    rendered = edit_table(table, insert)
+    return {'status': 'success', 'table': table, 'row': len(load_csv_data()[table]) - 1,
+            'replies_rendered': rendered, 'snapshot': get_data_snapshot()}, 201
+
+@app.route('/admin/data/<table>/<int:row>', methods=['PATCH', 'DELETE'])
+def admin_edit_row(table, row):
+    """Admin API: update (PATCH) or delete (DELETE) one row of a table by position"""
+    error = check_admin_token() or editable_table(table)
+    if error:
+        return error
+    
+    # Rows are checked against the file inside edit_table's lock, not this worker's loaded copy
+    if request.method == 'DELETE':
+        def edit(raw):
+            if row >= len(raw):
+                raise RowNotFound(row)
+            return raw.drop(index=row).reset_index(drop=True)
+    else:
+        values, error = row_values(table, partial=True)
+        if error:
+            return error
+        def edit(raw):
+            if row >= len(raw):
+                raise RowNotFound(row)
+            for column, value in values.items():
+                raw.at[row, column] = value
+            return raw
+    try:
+        rendered = edit_table(table, edit)
+    except RowNotFound:
+        return {'status': 'error', 'error': f'Row {row} not found in {table}'}, 404
+    return {'status': 'success', 'table': table, 'row': row,
+            'replies_rendered': rendered, 'snapshot': get_data_snapshot()}
+
+@app.route('/charts/<filename>')
+def chart_image(filename):
+    """Serve a cached chart image; filenames are content hashes so they never change"""
+    if not dypcet_charts.CHART_FILENAME_PATTERN.match(filename):
+        return {'status': 'error', 'error': 'Chart not found'}, 404
+    response = send_from_directory(
+        os.path.abspath(CHART_CACHE_DIR), filename,
+        mimetype='image/png', max_age=CHART_MAX_AGE, etag=filename[:-len('.png')],
+    )
+    response.headers['Cache-Control'] = f'public, max-age={CHART_MAX_AGE}, immutable'
+    return response
 
 @app.route('/test-whatsapp', methods=['POST'])
 def test_whatsapp():
     """Test WhatsApp functionality without Twilio"""
     try:
         test_message = request.json.get('message', 'hello') if request.is_json else request.form.get('message', 'hello')
-        response = process_whatsapp_message(test_message)
+        sender = request.json.get('sender') if request.is_json else request.form.get('sender')
+        # A sender makes reminders and other per-number actions possible, so only admins may set one
+        if sender:
+            error = check_admin_token()
+            if error:
+                return error
+        response = process_whatsapp_message(test_message, sender)
         return {'status': 'success', 'message': test_message, 'response': response}
     except Exception as e:
         return {'status': 'error', 'error': str(e)}
 
+# Warm-up: everything a request may need is built before /ready reports 200
+READY_EVENT = threading.Event()
+WARM_UP_TIMINGS = {}
+WARM_UP_FAILURES = {}
+_warm_up_lock = threading.Lock()
+_warm_up_thread = None
+
+WARM_UP_STEPS = [
+    ('pandas', lambda: pd.DataFrame),
+    ('twilio', lambda: twiml.MessagingResponse),
+    ('csv_data', load_csv_data),
+    ('bus_stop_index', load_bus_stop_index),
+    ('numeric_indexes', load_numeric_indexes),
+    ('data_snapshot', get_data_snapshot),
+    ('reply_catalog', compile_reply_catalog),
+    ('menu', compile_menu),
+    ('placement_charts', prerender_placement_charts),
+    ('reminders', start_reminders),
+    ('data_watcher', start_data_watcher),
+]
+# Steps the worker can serve without; any other failed step keeps /ready at 503
+OPTIONAL_WARM_UP_STEPS = ('placement_charts', 'reminders')
+
+def warm_up():
+    """Run every warm-up step and mark the worker as ready unless a required step failed"""
+    started = time.perf_counter()
+    WARM_UP_FAILURES.clear()
+    for name, step in WARM_UP_STEPS:
+        step_started = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            WARM_UP_FAILURES[name] = str(e)
+            print(f"❌ Warm-up step {name} failed: {str(e)}")
+        WARM_UP_TIMINGS[name] = time.perf_counter() - step_started
+    WARM_UP_TIMINGS['total'] = time.perf_counter() - started
+    failed = [name for name in WARM_UP_FAILURES if name not in OPTIONAL_WARM_UP_STEPS]
+    if failed:
+        print(f"❌ Warm-up failed ({', '.join(failed)}), retrying on the next request")
+        return
+    READY_EVENT.set()
+    print(f"✅ Warm-up finished in {WARM_UP_TIMINGS['total']:.2f}s")
+
+def start_warm_up():
+    """Start warm-up in a background thread, again if a previous attempt failed"""
+    global _warm_up_thread
+    with _warm_up_lock:
+        if _warm_up_thread is None or not (_warm_up_thread.is_alive() or READY_EVENT.is_set()):
+            _warm_up_thread = threading.Thread(target=warm_up, name='warm-up', daemon=True)
+            _warm_up_thread.start()
+    return _warm_up_thread
+
+@app.before_request
+def ensure_warm_up():
+    """Kick off warm-up on the first request if the server did not start it"""
+    if not READY_EVENT.is_set():
+        start_warm_up()
+
+@app.route('/ready')
+def ready():
+    """Readiness probe: 200 once every required warm-up step has succeeded, 503 before that"""
+    if READY_EVENT.is_set():
+        return {'status': 'ready', 'warm_up_seconds': WARM_UP_TIMINGS, 'failed_steps': WARM_UP_FAILURES}, 200
+    return {'status': 'warming_up', 'failed_steps': WARM_UP_FAILURES}, 503
+
 if __name__ == '__main__':
-    print("Loading CSV data...")
-    load_csv_data()  # Load data on startup
+    # The debug reloader runs this module twice; only the child process (WERKZEUG_RUN_MAIN) serves requests
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        print("Warming up...")
+        start_warm_up()
     print("DYPCET WhatsApp Bot starting...")
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,190 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import timeit
+from contextlib import contextmanager
+from functools import lru_cache
+
+import app
+
+# Micro-benchmarks for the reply builders and the router, with a regression check against a baseline
+
+# The baseline holds timings from one machine, so it is recorded locally (--update-baseline), never committed
+BASELINE_FILE = os.environ.get('BENCHMARK_BASELINE', 'benchmark_baseline.json')
+DEFAULT_THRESHOLD = float(os.environ.get('BENCHMARK_THRESHOLD', '0.25'))
+# Each case is compared as a multiple of a fixed reference workload timed right next to it, and the median of
+# several rounds is kept, so a machine that speeds up or slows down between runs does not look like a regression.
+# How far a case's rounds disagree (its spread) is added to the threshold as that case's own noise floor.
+DEFAULT_ROUNDS = int(os.environ.get('BENCHMARK_ROUNDS', '3'))
+
+# Tables are never scaled (the wide combined table is not used by any reply)
+UNSCALED_TABLES = ('complete_data',)
+
+# (name, callable, inputs, scales)
+BUILDER_SCALES = (1, 10, 100, 1000)
+ROUTER_SCALES = (1, 10)
+BENCHMARKS = [
+    ('get_courses_info', app.get_courses_info, ['', 'ug courses', 'pg'], BUILDER_SCALES),
+    ('get_specializations_info', app.get_specializations_info, ['', 'cse'], BUILDER_SCALES),
+    ('get_placement_info', lambda query: app.get_placement_info(), [''], BUILDER_SCALES),
+    ('get_rankings_info', lambda query: app.get_rankings_info(), [''], BUILDER_SCALES),
+    ('get_facilities_info', app.get_facilities_info, ['', 'lab'], BUILDER_SCALES),
+    ('get_college_info', lambda query: app.get_college_info(), [''], BUILDER_SCALES),
+    ('get_bus_routes_info', app.get_bus_routes_info, ['', 'rukadi fata'], BUILDER_SCALES),
+    ('get_admission_requirements', lambda query: app.get_admission_requirements(), [''], BUILDER_SCALES),
+    ('get_faculty_achievements', lambda query: app.get_faculty_achievements(), [''], BUILDER_SCALES),
+    ('get_student_achievements', lambda query: app.get_student_achievements(), [''], BUILDER_SCALES),
+    ('process_whatsapp_message', app.process_whatsapp_message, [
+        'hi',
+        'courses',
+        'bus from rukadi',
+        'companies above 6 LPA',
+        'placement kitna hai',
+        'कागल बस कधी आहे?',
+    ], ROUTER_SCALES),
+]
+
+def clear_derived_caches():
+    """Drop every structure derived from the loaded tables"""
+    for cached in (app.load_bus_stop_index, app.load_numeric_indexes,
+                   app.compile_reply_catalog, app.render_uncompiled_reply):
+        cached.cache_clear()
+
+@contextmanager
+def scaled_data(factor):
+    """Serve every table repeated factor times while the block runs"""
+    base = app.load_csv_data()
+    scaled = {
+        key: df if factor == 1 or key in UNSCALED_TABLES else app.pd.concat([df] * factor, ignore_index=True)
+        for key, df in base.items()
+    }
+    original = app.load_csv_data
+    app.load_csv_data = lambda: scaled
+    clear_derived_caches()
+    try:
+        yield
+    finally:
+        app.load_csv_data = original
+        clear_derived_caches()
+
+def time_call(fn, repeat):
+    """Median per-call time of fn in seconds (steadier than the best run between processes)"""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return statistics.median(timer.repeat(repeat=repeat, number=number)) / number
+
+@lru_cache(maxsize=None)
+def reference_table():
+    """Fixed table for the reference workload (built on first use, pandas is imported lazily)"""
+    return app.pd.DataFrame({'name': [f"Item {i}" for i in range(200)], 'value': [i * 0.5 for i in range(200)]})
+
+def reference_workload():
+    """Filter and format a fixed table like a reply builder does; its speed only depends on the machine"""
+    table = reference_table()
+    rows = table[table['value'] > 10]
+    return '\n'.join(f"• {row['name']}: {row['value']:.1f}" for _, row in rows.iterrows())
+
+def run_benchmarks(scales, repeat, rounds):
+    """Time every benchmark case; returns {case name: {'seconds', 'relative' (to the reference), 'spread'}}"""
+    samples = {}
+    for round_number in range(1, rounds + 1):
+        print(f"Round {round_number}/{rounds}...")
+        for scale in scales:
+            with scaled_data(scale):
+                reference = time_call(reference_workload, repeat)
+                for name, fn, inputs, benchmark_scales in BENCHMARKS:
+                    if scale not in benchmark_scales:
+                        continue
+                    for query in inputs:
+                        seconds = time_call(lambda: fn(query), repeat)
+                        # The reference timed after this case is the one before the next case
+                        after = time_call(reference_workload, repeat)
+                        samples.setdefault(f"{name}[{query}]@{scale}x", []).append((seconds, (reference + after) / 2))
+                        reference = after
+
+    results = {}
+    for case, runs in samples.items():
+        relative = [seconds / reference for seconds, reference in runs]
+        median = statistics.median(relative)
+        results[case] = {
+            'seconds': statistics.median(seconds for seconds, _ in runs),
+            'relative': median,
+            'spread': (max(relative) - min(relative)) / median,
+        }
+        print(f"{case:<60} {results[case]['seconds'] * 1e6:12.1f} µs {median:8.3f}x ref ±{results[case]['spread']:.0%}")
+    return results
+
+def compare(results, baseline, threshold):
+    """Return the cases whose time relative to the reference regressed beyond threshold plus their noise"""
+    regressions = []
+    for case, timing in results.items():
+        previous = baseline.get(case)
+        # Baselines recorded before reference timings hold bare seconds and cannot be compared
+        if not isinstance(previous, dict):
+            continue
+        noise = max(previous.get('spread', 0), timing['spread'])
+        if timing['relative'] > previous['relative'] * (1 + threshold + noise):
+            regressions.append((case, previous, timing, noise))
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="DYPCET bot reply builder micro-benchmarks")
+    parser.add_argument('--scales', default=','.join(str(s) for s in BUILDER_SCALES),
+                        help="comma-separated dataset scale factors (default: %(default)s)")
+    parser.add_argument('--repeat', type=int, default=3, help="timing repeats per case and round")
+    parser.add_argument('--rounds', type=int, default=DEFAULT_ROUNDS,
+                        help="passes over every case; each case keeps its median (default: %(default)s)")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown as a fraction of the baseline (default: %(default)s)")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="baseline results file")
+    parser.add_argument('--update-baseline', action='store_true', help="record results as the new baseline")
+    args = parser.parse_args(argv)
+
+    # Never send reminders or compact the shared journal from a benchmark run
+    app.REMINDER_SCHEDULER = False
+    app.warm_up()
+    scales = [int(s) for s in args.scales.split(',') if s.strip()]
+
+    print("="*60)
+    print("DYPCET BOT MICRO-BENCHMARKS")
+    print("="*60)
+    results = run_benchmarks(scales, args.repeat, args.rounds)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True, ensure_ascii=False)
+            f.write('\n')
+        print(f"\nBaseline saved to {args.baseline} ({len(results)} cases)")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nNo baseline at {args.baseline}; run with --update-baseline to record one")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if not any(isinstance(timing, dict) for timing in baseline.values()):
+        print(f"\nBaseline at {args.baseline} predates reference timings; run with --update-baseline to record a new one")
+        return 0
+    regressions = compare(results, baseline, args.threshold)
+
+    print("="*60)
+    if regressions:
+        print(f"❌ {len(regressions)} case(s) regressed by more than {args.threshold:.0%} plus their noise:")
+        for case, previous, timing, noise in regressions:
+            print(f"   {case}: {previous['seconds'] * 1e6:.1f} µs -> {timing['seconds'] * 1e6:.1f} µs, "
+                  f"{previous['relative']:.3f}x -> {timing['relative']:.3f}x ref "
+                  f"({timing['relative'] / previous['relative'] - 1:+.0%}, noise {noise:.0%})")
+        return 1
+    print(f"✅ No regressions beyond {args.threshold:.0%} plus noise ({len(results)} cases)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+import hashlib
+import importlib.util
+import json
+import os
+import re
+
+import dypcet_numeric
+
+# DYPCET chart images: content-addressed PNG cache for WhatsApp media replies
+
+# Bump when the chart styling changes so cached images are re-rendered
+CHART_STYLE_VERSION = '1'
+
+CHART_FILENAME_PATTERN = re.compile(r'^[0-9a-f]{40}\.png$')
+
+def charts_available():
+    """True if matplotlib (optional dependency) is installed"""
+    return importlib.util.find_spec('matplotlib') is not None
+
+def chart_filename(spec):
+    """Content-addressed filename for a chart spec"""
+    payload = json.dumps({'version': CHART_STYLE_VERSION, **spec}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode()).hexdigest() + '.png'
+
+def render_bar_chart(path, spec):
+    """Render a bar chart spec to a PNG file"""
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=(8, 4.5), dpi=120)
+    axes = figure.subplots()
+    if spec.get('horizontal'):
+        bars = axes.barh(spec['labels'], spec['values'], color='#1f6fb2')
+        axes.invert_yaxis()
+        axes.set_xlabel(spec['value_label'])
+    else:
+        bars = axes.bar(spec['labels'], spec['values'], color='#1f6fb2')
+        axes.set_ylabel(spec['value_label'])
+    axes.bar_label(bars, fmt='%g', padding=3)
+    axes.set_title(spec['title'])
+    axes.spines[['top', 'right']].set_visible(False)
+    figure.tight_layout()
+
+    # Write to a temporary file first so readers never see a partial image
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    figure.savefig(tmp_path, format='png')
+    os.replace(tmp_path, path)
+
+def ensure_chart(cache_dir, spec):
+    """Render a chart into the cache unless it is already there; return its filename"""
+    filename = chart_filename(spec)
+    path = os.path.join(cache_dir, filename)
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        render_bar_chart(path, spec)
+    return filename
+
+def package_distribution_spec(placements_df):
+    """Chart spec for the 'Top N Packages' rows of the placements table"""
+    labels = []
+    values = []
+    for metric, value in zip(placements_df['Metric'], placements_df['Value']):
+        match = re.match(r'Top (\d+) Packages', str(metric))
+        if match:
+            labels.append(str(value))
+            values.append(int(match.group(1)))
+    return {
+        'title': 'DYPCET Package Distribution (2023-24)',
+        'labels': labels,
+        'values': values,
+        'value_label': 'Students',
+    }
+
+def recruiter_packages_spec(recruiters_df):
+    """Chart spec comparing the package offered by each recruiter"""
+    labels = []
+    values = []
+    for company, package in zip(recruiters_df['Company'], recruiters_df['Package']):
+        lpa = dypcet_numeric.parse_numeric_range(package)[1]
+        if lpa is not None:
+            labels.append(str(company))
+            values.append(lpa)
+    return {
+        'title': 'DYPCET Top Recruiters - Package (LPA)',
+        'labels': labels,
+        'values': values,
+        'value_label': 'LPA',
+        'horizontal': True,
+    }
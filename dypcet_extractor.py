@@ -1,9 +1,18 @@
+import argparse
+import importlib.util
+import os
+import timeit
 import pandas as pd
 import csv
 from io import StringIO
 
 # DYPCET College Information Extraction and CSV Generation
 
+COMBINED_CSV = 'dypcet_complete_data.csv'
+# Names behind the integer Data_Category and Attribute codes in the combined CSV
+COMBINED_CODES_CSV = 'dypcet_complete_data_codes.csv'
+COMBINED_PARQUET = 'dypcet_complete_data.parquet'
+
 def create_college_info_csv():
     """Create CSV with basic college information"""
     college_info = [
@@ -289,7 +298,7 @@ def create_rankings_csv():
     
     return pd.DataFrame(rankings)
 
-def save_all_csvs():
+def save_all_csvs(compare_formats=False):
     """Generate and save all CSV files"""
     
     # Create all dataframes
@@ -313,30 +322,109 @@ def save_all_csvs():
         df.to_csv(filename, index=False)
         print(f"Created: {filename} ({len(df)} rows)")
     
-    # Create a comprehensive combined CSV
-    combined_data = []
-    for category, df in dataframes.items():
-        for _, row in df.iterrows():
-            row_dict = row.to_dict()
-            row_dict['Data_Category'] = category.replace('_', ' ').title()
-            combined_data.append(row_dict)
+    # Create a comprehensive combined CSV in long (entity-attribute-value) layout,
+    # with category and attribute names stored once in a separate codes file
+    combined_df = build_long_format(dataframes)
+    coded_df, codes_df = encode_long_format(combined_df)
+    coded_df.to_csv(COMBINED_CSV, index=False)
+    codes_df.to_csv(COMBINED_CODES_CSV, index=False)
+    print(f"Created: {COMBINED_CSV} ({len(coded_df)} rows) and {COMBINED_CODES_CSV} ({len(codes_df)} codes)")
     
-    # Save combined CSV
-    combined_df = pd.DataFrame(combined_data)
-    combined_df.to_csv('dypcet_complete_data.csv', index=False)
-    print(f"Created: dypcet_complete_data.csv ({len(combined_df)} rows)")
+    # Columnar copy with dictionary-encoded strings, if pyarrow is installed
+    if parquet_available():
+        combined_df.to_parquet(COMBINED_PARQUET, index=False)
+        print(f"Created: {COMBINED_PARQUET} ({len(combined_df)} rows)")
+    
+    if compare_formats:
+        report_combined_formats(build_wide_format(dataframes), coded_df, codes_df)
     
     return dataframes
 
-def display_summary():
+def parquet_available():
+    """True if pyarrow (optional dependency) is installed"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+def build_long_format(dataframes):
+    """Combine all tables into one long table: Data_Category, Row, Attribute, Value"""
+    frames = []
+    for category, df in dataframes.items():
+        long_df = (
+            df.rename_axis('Row').reset_index()
+            # Several tables already have a 'Value' column, so melt under a temporary name
+            .melt(id_vars='Row', var_name='Attribute', value_name='_value')
+            .rename(columns={'_value': 'Value'})
+            .sort_values('Row', kind='stable')
+        )
+        # Empty cells are simply not stored
+        values = long_df['Value'].astype('string').str.strip()
+        long_df = long_df[values.notna() & (values != '')]
+        long_df.insert(0, 'Data_Category', category.replace('_', ' ').title())
+        frames.append(long_df)
+    
+    combined_df = pd.concat(frames, ignore_index=True)
+    # Small repeated vocabularies are dictionary-encoded
+    combined_df['Data_Category'] = combined_df['Data_Category'].astype('category')
+    combined_df['Attribute'] = combined_df['Attribute'].astype('category')
+    combined_df['Value'] = combined_df['Value'].astype('string')
+    return combined_df
+
+def encode_long_format(long_df):
+    """Replace the category and attribute names with integer codes; returns (coded table, codes table)"""
+    coded_df = long_df.copy()
+    codes = []
+    for column in ('Data_Category', 'Attribute'):
+        names = long_df[column].cat.categories
+        codes.append(pd.DataFrame({'Column': column, 'Code': range(len(names)), 'Name': names}))
+        coded_df[column] = long_df[column].cat.codes
+    return coded_df, pd.concat(codes, ignore_index=True)
+
+def read_combined_data(path=COMBINED_CSV, codes_path=COMBINED_CODES_CSV):
+    """Load the combined long table with its category and attribute codes decoded"""
+    df = pd.read_csv(path, dtype={'Value': 'string'})
+    codes = pd.read_csv(codes_path)
+    for column, names in codes.groupby('Column'):
+        df[column] = pd.Categorical.from_codes(df[column], categories=names.sort_values('Code')['Name'].tolist())
+    return df
+
+def build_wide_format(dataframes):
+    """Combine all tables into the previous wide layout (one column per attribute)"""
+    return pd.concat(
+        [df.assign(Data_Category=category.replace('_', ' ').title()) for category, df in dataframes.items()],
+        ignore_index=True,
+    )
+
+def best_load_time(load, repeat=5):
+    """Best time (seconds) of one call to load()"""
+    return min(timeit.repeat(load, repeat=repeat, number=1))
+
+def report_combined_formats(wide_df, coded_df, codes_df):
+    """Print size and load-time of the saved coded long layout versus the previous wide CSV"""
+    wide_csv = wide_df.to_csv(index=False)
+    wide_size = len(wide_csv.encode())
+    long_size = os.path.getsize(COMBINED_CSV) + os.path.getsize(COMBINED_CODES_CSV)
+    wide_time = best_load_time(lambda: pd.read_csv(StringIO(wide_csv)))
+    # Reading both files and decoding the codes is the real cost of loading the long layout
+    long_time = best_load_time(read_combined_data)
+    
+    print(f"\nCombined data: wide CSV {wide_df.shape[0]}x{wide_df.shape[1]}, "
+          f"long CSV {coded_df.shape[0]}x{coded_df.shape[1]} + {len(codes_df)} codes")
+    print(f"   Size:      {wide_size:,} -> {long_size:,} bytes ({long_size / wide_size - 1:+.0%})")
+    print(f"   Load time: {wide_time * 1000:.2f} -> {long_time * 1000:.2f} ms ({long_time / wide_time - 1:+.0%})")
+    if os.path.exists(COMBINED_PARQUET):
+        parquet_size = os.path.getsize(COMBINED_PARQUET)
+        parquet_time = best_load_time(lambda: pd.read_parquet(COMBINED_PARQUET))
+        print(f"   Parquet:   {parquet_size:,} bytes ({parquet_size / wide_size - 1:+.0%}), "
+              f"{parquet_time * 1000:.2f} ms ({parquet_time / wide_time - 1:+.0%}) vs wide CSV")
+
+def display_summary(compare_formats=False):
     """Display summary of extracted information"""
     print("\n" + "="*60)
     print("DYPCET INFORMATION EXTRACTION SUMMARY")
     print("="*60)
     
-    dataframes = save_all_csvs()
+    dataframes = save_all_csvs(compare_formats)
     
-    print(f"\nTotal CSV files created: {len(dataframes) + 1}")
+    print(f"\nTotal CSV files created: {len(dataframes) + 2}")
     print("\nData Categories Extracted:")
     for i, (name, df) in enumerate(dataframes.items(), 1):
         print(f"{i:2d}. {name.replace('_', ' ').title():<25} - {len(df):3d} records")
@@ -354,4 +442,7 @@ def display_summary():
     print("="*60)
 
 if __name__ == "__main__":
-    display_summary()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate the DYPCET data CSV files")
+    parser.add_argument('--compare-formats', action='store_true',
+                        help="also print size and load time of the combined data versus the old wide CSV")
+    display_summary(parser.parse_args().compare_formats)
\ No newline at end of file
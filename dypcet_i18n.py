@@ -0,0 +1,456 @@
+import re
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+
+# DYPCET bot localization: input normalization, language detection and reply catalogs
+
+SUPPORTED_LANGUAGES = ('en', 'mr', 'hi')
+DEFAULT_LANGUAGE = 'en'
+
+NormalizedMessage = namedtuple('NormalizedMessage', ['text', 'search_text', 'language'])
+
+# Devanagari -> Latin transliteration (simplified, case-insensitive ITRANS-like)
+DEVANAGARI_VOWELS = {
+    'अ': 'a', 'आ': 'aa', 'इ': 'i', 'ई': 'ee', 'उ': 'u', 'ऊ': 'oo', 'ऋ': 'ru',
+    'ए': 'e', 'ऐ': 'ai', 'ओ': 'o', 'औ': 'au', 'ऍ': 'e', 'ऑ': 'o',
+}
+DEVANAGARI_CONSONANTS = {
+    'क': 'k', 'ख': 'kh', 'ग': 'g', 'घ': 'gh', 'ङ': 'n',
+    'च': 'ch', 'छ': 'chh', 'ज': 'j', 'झ': 'jh', 'ञ': 'n',
+    'ट': 't', 'ठ': 'th', 'ड': 'd', 'ढ': 'dh', 'ण': 'n',
+    'त': 't', 'थ': 'th', 'द': 'd', 'ध': 'dh', 'न': 'n',
+    'प': 'p', 'फ': 'ph', 'ब': 'b', 'भ': 'bh', 'म': 'm',
+    'य': 'y', 'र': 'r', 'ल': 'l', 'ळ': 'l', 'व': 'v',
+    'श': 'sh', 'ष': 'sh', 'स': 's', 'ह': 'h',
+}
+DEVANAGARI_MATRAS = {
+    'ा': 'aa', 'ि': 'i', 'ी': 'ee', 'ु': 'u', 'ू': 'oo', 'ृ': 'ru',
+    'े': 'e', 'ै': 'ai', 'ो': 'o', 'ौ': 'au', 'ॅ': 'e', 'ॉ': 'o',
+}
+DEVANAGARI_SIGNS = {'ं': 'n', 'ँ': 'n', 'ः': 'h'}
+DEVANAGARI_VIRAMA = '्'
+DEVANAGARI_NUKTA = '़'
+DEVANAGARI_DIGITS = {chr(0x0966 + i): str(i) for i in range(10)}
+
+# Characters removed before routing (emoji joiners and variation selectors)
+EMOJI_JOINERS = {'\u200d', '\ufe0e', '\ufe0f', '\u20e3'}
+
+TOKEN_PATTERN = re.compile(r'[\w\u0900-\u097f]+')
+
+# Marker words that identify Marathi or Hindi (Devanagari and transliterated)
+LANGUAGE_MARKERS = {
+    'mr': {
+        'आहे', 'आहेत', 'कुठे', 'कुठून', 'काय', 'मला', 'किती', 'सांगा', 'पाहिजे', 'कधी',
+        'aahe', 'ahe', 'aahet', 'ahet', 'kuthe', 'kuthun', 'kay', 'mala', 'kiti',
+        'sanga', 'saanga', 'pahije', 'paahije', 'kadhi', 'konta', 'kontya',
+    },
+    'hi': {
+        'है', 'हैं', 'क्या', 'कितना', 'कितनी', 'कितने', 'कहाँ', 'कहां', 'मुझे', 'बताओ', 'चाहिए', 'कब',
+        'hai', 'hain', 'kya', 'kitna', 'kitni', 'kitne', 'kahan', 'kaha', 'mujhe',
+        'batao', 'bataiye', 'kab', 'kaun', 'kaunsa', 'chahiye',
+    },
+}
+
+# Per-language keyword tables: local word -> English router keyword
+LOCALIZED_KEYWORDS = {
+    'mr': {
+        'अभ्यासक्रम': 'course', 'abhyaskram': 'course', 'कोर्स': 'course',
+        'पदवी': 'ug', 'padavi': 'ug', 'पदव्युत्तर': 'pg', 'padavyuttar': 'pg',
+        'शाखा': 'branch', 'shakha': 'branch', 'विभाग': 'department', 'vibhag': 'department',
+        'संगणक': 'computer science', 'sanganak': 'computer science',
+        'सुविधा': 'facilities', 'suvidha': 'facilities', 'प्रयोगशाळा': 'lab', 'prayogshala': 'lab',
+        'वसतिगृह': 'hostel', 'vasatigruh': 'hostel', 'ग्रंथालय': 'library', 'granthalay': 'library',
+        'नोकरी': 'job', 'nokri': 'job', 'nokari': 'job', 'पगार': 'salary', 'pagar': 'salary',
+        'प्लेसमेंट': 'placement', 'पॅकेज': 'package', 'आलेख': 'chart', 'ग्राफ': 'chart',
+        'कॉलेज': 'college', 'महाविद्यालय': 'college', 'mahavidyalay': 'college', 'kolej': 'college',
+        'रँकिंग': 'ranking', 'मानांकन': 'accreditation', 'manankan': 'accreditation',
+        'बस': 'bus', 'bas': 'bus', 'गाडी': 'bus', 'gadi': 'bus', 'gaadi': 'bus',
+        'वाहतूक': 'transport', 'vahatuk': 'transport', 'भाडे': 'fare', 'bhade': 'fare',
+        'प्रवेश': 'admission', 'pravesh': 'admission', 'पात्रता': 'eligibility', 'patrata': 'eligibility',
+        'कागदपत्रे': 'document', 'kagadpatre': 'document',
+        'प्राध्यापक': 'faculty', 'pradhyapak': 'faculty', 'शिक्षक': 'teacher', 'shikshak': 'teacher',
+        'संशोधन': 'research', 'sanshodhan': 'research',
+        'पुरस्कार': 'award', 'puraskar': 'award', 'स्पर्धा': 'competition', 'spardha': 'competition',
+        'खेळ': 'sports', 'khel': 'sports',
+        'नमस्कार': 'hello', 'namaskar': 'hello', 'मदत': 'help', 'madat': 'help',
+        'स्वस्त': 'cheapest', 'swasta': 'cheapest', 'स्वस्तात': 'cheapest',
+        'आठवण': 'remind', 'aathavan': 'remind', 'athavan': 'remind',
+        'मुदत': 'deadline', 'mudat': 'deadline', 'मुदतीची': 'deadline',
+    },
+    'hi': {
+        'कोर्स': 'course', 'पाठ्यक्रम': 'course', 'pathyakram': 'course',
+        'स्नातक': 'ug', 'snatak': 'ug', 'स्नातकोत्तर': 'pg', 'snatakottar': 'pg',
+        'ब्रांच': 'branch', 'शाखा': 'branch', 'विभाग': 'department',
+        'कंप्यूटर': 'computer science',
+        'सुविधाएँ': 'facilities', 'सुविधाएं': 'facilities', 'सुविधा': 'facilities', 'suvidhaye': 'facilities',
+        'लैब': 'lab', 'प्रयोगशाला': 'lab', 'prayogshala': 'lab',
+        'छात्रावास': 'hostel', 'chhatravas': 'hostel', 'पुस्तकालय': 'library', 'pustakalay': 'library',
+        'नौकरी': 'job', 'naukri': 'job', 'वेतन': 'salary', 'vetan': 'salary', 'तनख्वाह': 'salary',
+        'प्लेसमेंट': 'placement', 'पैकेज': 'package', 'ग्राफ': 'chart', 'चार्ट': 'chart',
+        'कॉलेज': 'college', 'महाविद्यालय': 'college', 'kolej': 'college',
+        'रैंकिंग': 'ranking', 'मान्यता': 'accreditation', 'manyata': 'accreditation',
+        'बस': 'bus', 'bas': 'bus', 'गाड़ी': 'bus', 'परिवहन': 'transport', 'parivahan': 'transport',
+        'किराया': 'fare', 'kiraya': 'fare',
+        'प्रवेश': 'admission', 'pravesh': 'admission', 'एडमिशन': 'admission', 'योग्यता': 'eligibility',
+        'yogyata': 'eligibility', 'दस्तावेज': 'document', 'dastavej': 'document',
+        'प्रोफेसर': 'professor', 'शिक्षक': 'teacher', 'adhyapak': 'teacher', 'अध्यापक': 'teacher',
+        'शोध': 'research', 'shodh': 'research',
+        'पुरस्कार': 'award', 'puraskar': 'award', 'प्रतियोगिता': 'competition', 'pratiyogita': 'competition',
+        'खेल': 'sports',
+        'नमस्ते': 'hello', 'namaste': 'hello', 'मदद': 'help', 'madad': 'help',
+        'सस्ती': 'cheapest', 'sasti': 'cheapest', 'सस्ता': 'cheapest', 'sasta': 'cheapest',
+        'याद': 'remind', 'yaad': 'remind', 'रिमाइंडर': 'remind',
+        'अंतिम': 'deadline', 'antim': 'deadline',
+    },
+}
+
+# Localized "stop reminders": a reminder word followed by "band" or "radd" ("आठवण बंद करा", "yaad band karo")
+LOCALIZED_REMINDER_STOP = re.compile(r'(?:आठवण|aathavan|athavan|याद|yaad|रिमाइंडर)\s+(?:बंद|band|रद्द|radd)')
+
+# Whole-message commands that set the sender's reply language
+LANGUAGE_COMMANDS = {
+    'english': 'en', 'इंग्रजी': 'en', 'अंग्रेजी': 'en', 'अंग्रेज़ी': 'en',
+    'marathi': 'mr', 'मराठी': 'mr',
+    'hindi': 'hi', 'हिंदी': 'hi', 'हिन्दी': 'hi',
+}
+
+# Fixed labels in the English replies and their translations, applied once per compiled reply
+REPLY_PHRASES = {
+    'mr': [
+        ('DYPCET Courses Available:', 'DYPCET मधील अभ्यासक्रम:'),
+        ('Undergraduate (B.Tech/B.Arch)', 'पदवी (B.Tech/B.Arch)'),
+        ('Postgraduate (M.Tech)', 'पदव्युत्तर (M.Tech)'),
+        ('Doctorate (Ph.D)', 'डॉक्टरेट (Ph.D)'),
+        ('DYPCET Specializations:', 'DYPCET स्पेशलायझेशन:'),
+        ('DYPCET Facilities:', 'DYPCET सुविधा:'),
+        ('DYPCET Placement Statistics (2023-24):', 'DYPCET प्लेसमेंट आकडेवारी (2023-24):'),
+        ('*Highest Package:*', '*सर्वोच्च पॅकेज:*'),
+        ('*Average Package:*', '*सरासरी पॅकेज:*'),
+        ('*Job Offers 2023-24:*', '*नोकरीच्या ऑफर 2023-24:*'),
+        ('*Campus Placement Drives:*', '*कॅम्पस प्लेसमेंट ड्राइव्ह:*'),
+        ('*Students Participated:*', '*सहभागी विद्यार्थी:*'),
+        ('Internship Programs:', 'इंटर्नशिप कार्यक्रम:'),
+        ('Package Distribution:', 'पॅकेज वितरण:'),
+        ('Top Recruiters:', 'प्रमुख कंपन्या:'),
+        ('About DYPCET:', 'DYPCET विषयी:'),
+        ('DYPCET Rankings & Accreditations:', 'DYPCET रँकिंग व मानांकन:'),
+        ('   Category: ', '   श्रेणी: '),
+        ('   Rank: ', '   क्रमांक: '),
+        ('   Grade: ', '   ग्रेड: '),
+        ('   Status: ', '   स्थिती: '),
+        ('   Period: ', '   कालावधी: '),
+        ('   Details: ', '   तपशील: '),
+        ('Year: ', 'वर्ष: '),
+        ('DYPCET Bus Routes:', 'DYPCET बस मार्ग:'),
+        ('DYPCET Buses for your stop:', 'तुमच्या थांब्यासाठी DYPCET बस:'),
+        ('*Route: ', '*मार्ग: '),
+        ('(starts at ', '(सुरुवात: '),
+        ('- stop ', '- थांबा '),
+        ('Departure Time:', 'सुटण्याची वेळ:'),
+        ('Monthly Fare:', 'मासिक भाडे:'),
+        ('Stops:', 'थांबे:'),
+        ('DYPCET Admission Requirements:', 'DYPCET प्रवेश पात्रता:'),
+        ('DYPCET Faculty Achievements:', 'DYPCET प्राध्यापकांची कामगिरी:'),
+        ('DYPCET Student Achievements:', 'DYPCET विद्यार्थ्यांची कामगिरी:'),
+        ('Student: ', 'विद्यार्थी: '),
+        ('information is currently unavailable.', 'माहिती सध्या उपलब्ध नाही.'),
+        ('*Recruiters (package ', '*कंपन्या (पॅकेज '),
+        ('*Top recruiters by package:*', '*सर्वाधिक पॅकेज देणाऱ्या कंपन्या:*'),
+        ('No recruiters match that package range.', 'या पॅकेज मर्यादेत कोणतीही कंपनी नाही.'),
+        ('*Buses (departure ', '*बस (सुटण्याची वेळ '),
+        ('*Buses (monthly fare ', '*बस (मासिक भाडे '),
+        ('*Cheapest buses:*', '*सर्वात स्वस्त बस:*'),
+        ('*Costliest buses:*', '*सर्वात महाग बस:*'),
+        ('*Earliest buses:*', '*सर्वात लवकर सुटणाऱ्या बस:*'),
+        ('*Latest buses:*', '*सर्वात उशिरा सुटणाऱ्या बस:*'),
+        ('No buses match that time or fare.', 'या वेळेत किंवा भाड्यात कोणतीही बस नाही.'),
+    ],
+    'hi': [
+        ('DYPCET Courses Available:', 'DYPCET में उपलब्ध कोर्स:'),
+        ('Undergraduate (B.Tech/B.Arch)', 'स्नातक (B.Tech/B.Arch)'),
+        ('Postgraduate (M.Tech)', 'स्नातकोत्तर (M.Tech)'),
+        ('Doctorate (Ph.D)', 'डॉक्टरेट (Ph.D)'),
+        ('DYPCET Specializations:', 'DYPCET स्पेशलाइज़ेशन:'),
+        ('DYPCET Facilities:', 'DYPCET सुविधाएँ:'),
+        ('DYPCET Placement Statistics (2023-24):', 'DYPCET प्लेसमेंट आँकड़े (2023-24):'),
+        ('*Highest Package:*', '*सबसे ऊँचा पैकेज:*'),
+        ('*Average Package:*', '*औसत पैकेज:*'),
+        ('*Job Offers 2023-24:*', '*नौकरी ऑफ़र 2023-24:*'),
+        ('*Campus Placement Drives:*', '*कैंपस प्लेसमेंट ड्राइव:*'),
+        ('*Students Participated:*', '*भाग लेने वाले छात्र:*'),
+        ('Internship Programs:', 'इंटर्नशिप प्रोग्राम:'),
+        ('Package Distribution:', 'पैकेज वितरण:'),
+        ('Top Recruiters:', 'प्रमुख कंपनियाँ:'),
+        ('About DYPCET:', 'DYPCET के बारे में:'),
+        ('DYPCET Rankings & Accreditations:', 'DYPCET रैंकिंग और मान्यता:'),
+        ('   Category: ', '   श्रेणी: '),
+        ('   Rank: ', '   रैंक: '),
+        ('   Grade: ', '   ग्रेड: '),
+        ('   Status: ', '   स्थिति: '),
+        ('   Period: ', '   अवधि: '),
+        ('   Details: ', '   विवरण: '),
+        ('Year: ', 'वर्ष: '),
+        ('DYPCET Bus Routes:', 'DYPCET बस रूट:'),
+        ('DYPCET Buses for your stop:', 'आपके स्टॉप के लिए DYPCET बसें:'),
+        ('*Route: ', '*रूट: '),
+        ('(starts at ', '(शुरुआत: '),
+        ('- stop ', '- स्टॉप '),
+        ('Departure Time:', 'प्रस्थान समय:'),
+        ('Monthly Fare:', 'मासिक किराया:'),
+        ('Stops:', 'स्टॉप:'),
+        ('DYPCET Admission Requirements:', 'DYPCET प्रवेश आवश्यकताएँ:'),
+        ('DYPCET Faculty Achievements:', 'DYPCET फैकल्टी उपलब्धियाँ:'),
+        ('DYPCET Student Achievements:', 'DYPCET छात्र उपलब्धियाँ:'),
+        ('Student: ', 'छात्र: '),
+        ('information is currently unavailable.', 'जानकारी अभी उपलब्ध नहीं है.'),
+        ('*Recruiters (package ', '*कंपनियाँ (पैकेज '),
+        ('*Top recruiters by package:*', '*सबसे ज़्यादा पैकेज देने वाली कंपनियाँ:*'),
+        ('No recruiters match that package range.', 'इस पैकेज सीमा में कोई कंपनी नहीं है.'),
+        ('*Buses (departure ', '*बसें (प्रस्थान '),
+        ('*Buses (monthly fare ', '*बसें (मासिक किराया '),
+        ('*Cheapest buses:*', '*सबसे सस्ती बसें:*'),
+        ('*Costliest buses:*', '*सबसे महंगी बसें:*'),
+        ('*Earliest buses:*', '*सबसे पहले जाने वाली बसें:*'),
+        ('*Latest buses:*', '*सबसे देर से जाने वाली बसें:*'),
+        ('No buses match that time or fare.', 'इस समय या किराये में कोई बस नहीं है.'),
+    ],
+}
+
+# Fixed replies that are translated as a whole rather than phrase by phrase
+LOCALIZED_REPLIES = {
+    'mr': {
+        'greeting_header': """👋 *DYPCET माहिती बॉटमध्ये आपले स्वागत आहे!*
+
+मी खालील माहिती देऊ शकतो:""",
+        'greeting_footer': """क्रमांक पाठवा (उदा. *1* अभ्यासक्रमांसाठी, *1.2* पदव्युत्तर अभ्यासक्रमांसाठी) किंवा DYPCET विषयी काहीही विचारा! उदाहरणार्थ:
+• "अभ्यासक्रम सांगा"
+• "सुविधा काय आहेत?"
+• "प्लेसमेंट किती आहे?"
+• "कागल बस कधी आहे?"
+• "english" / "hindi" लिहून भाषा बदला""",
+        'default': """❓ माफ करा, मला तुमचा प्रश्न समजला नाही.
+
+मी या विषयांवर माहिती देऊ शकतो:
+• *अभ्यासक्रम* - UG/PG/PhD
+• *स्पेशलायझेशन* - विभागानुसार
+• *सुविधा* - लॅब, वसतिगृह, ग्रंथालय
+• *प्लेसमेंट* - आकडेवारी, कंपन्या, पॅकेज
+• *कॉलेज* - DYPCET विषयी
+• *रँकिंग* - NAAC, NBA
+• *बस* - मार्ग, वेळ, भाडे
+• *प्रवेश* - पात्रता, कागदपत्रे
+• *प्राध्यापक* - संशोधन
+• *विद्यार्थी* - पुरस्कार
+
+कृपया यापैकी एखाद्या विषयावर विचारा! 😊""",
+        'language_set': "✅ आता मी तुम्हाला मराठीत उत्तर देईन.",
+        'fallback': "⏳ माफ करा, उत्तर द्यायला नेहमीपेक्षा जास्त वेळ लागत आहे. कृपया एका मिनिटाने पुन्हा विचारा.",
+        'deferred': "⏳ माहिती शोधत आहे, थोड्याच वेळात पाठवतो.",
+        'throttled': "✋ तुम्ही खूप वेगाने संदेश पाठवत आहात. कृपया थोड्या वेळाने पुन्हा प्रयत्न करा.",
+        'busy': "⏳ सध्या खूप प्रश्न येत आहेत. कृपया एका मिनिटाने पुन्हा विचारा.",
+        'reminder_bus_set': "✅ {routes} बस सुटण्याच्या {lead} मिनिटे आधी मी तुम्हाला रोज आठवण करून देईन. रद्द करण्यासाठी *stop reminders* पाठवा.",
+        'reminder_admission_set': "✅ {deadlines} - मुदतीच्या {days} दिवस आधी आणि त्या दिवशी मी तुम्हाला आठवण करून देईन. रद्द करण्यासाठी *stop reminders* पाठवा.",
+        'reminder_none': "📅 सध्या आठवण करून देण्यासाठी प्रवेशाची कोणतीही आगामी मुदत नाही.",
+        'reminder_help': "⏰ मी तुम्हाला आठवण करून देऊ शकतो. उदा. *कागल बस आठवण* किंवा *प्रवेश मुदत आठवण* पाठवा.",
+        'reminder_stopped': "✅ तुमच्या सर्व आठवणी रद्द केल्या आहेत.",
+        'reminder_bus': "⏰ *आठवण:* {route} बस {time} ला सुटेल, {lead} मिनिटांत.",
+        'reminder_admission': "⏰ *आठवण:* {requirement} - {details} (मुदत {date}).",
+    },
+    'hi': {
+        'greeting_header': """👋 *DYPCET सूचना बॉट में आपका स्वागत है!*
+
+मैं इन विषयों पर जानकारी दे सकता हूँ:""",
+        'greeting_footer': """नंबर भेजें (जैसे कोर्स के लिए *1*, M.Tech कोर्स के लिए *1.2*) या DYPCET के बारे में कुछ भी पूछिए! उदाहरण:
+• "कोर्स बताओ"
+• "सुविधाएँ क्या हैं?"
+• "placement kitna hai"
+• "कागल बस कब है?"
+• भाषा बदलने के लिए "english" / "marathi" लिखें""",
+        'default': """❓ माफ़ कीजिए, मैं आपका सवाल समझ नहीं पाया.
+
+मैं इन विषयों पर जानकारी दे सकता हूँ:
+• *कोर्स* - UG/PG/PhD
+• *स्पेशलाइज़ेशन* - विभाग अनुसार
+• *सुविधाएँ* - लैब, छात्रावास, पुस्तकालय
+• *प्लेसमेंट* - आँकड़े, कंपनियाँ, पैकेज
+• *कॉलेज* - DYPCET के बारे में
+• *रैंकिंग* - NAAC, NBA
+• *बस* - रूट, समय, किराया
+• *प्रवेश* - योग्यता, दस्तावेज
+• *फैकल्टी* - शोध
+• *छात्र* - पुरस्कार
+
+कृपया इनमें से किसी विषय पर पूछिए! 😊""",
+        'language_set': "✅ अब मैं आपको हिंदी में जवाब दूँगा.",
+        'fallback': "⏳ माफ़ कीजिए, जवाब देने में सामान्य से ज़्यादा समय लग रहा है. कृपया एक मिनट बाद फिर पूछिए.",
+        'deferred': "⏳ जानकारी ढूँढ रहा हूँ, थोड़ी देर में भेजता हूँ.",
+        'throttled': "✋ आप बहुत तेज़ी से संदेश भेज रहे हैं. कृपया थोड़ी देर बाद फिर कोशिश करें.",
+        'busy': "⏳ अभी बहुत सारे सवाल आ रहे हैं. कृपया एक मिनट बाद फिर पूछिए.",
+        'reminder_bus_set': "✅ {routes} बस छूटने से {lead} मिनट पहले मैं आपको रोज़ याद दिलाऊँगा. रद्द करने के लिए *stop reminders* भेजें.",
+        'reminder_admission_set': "✅ {deadlines} - अंतिम तारीख से {days} दिन पहले और उसी दिन मैं आपको याद दिलाऊँगा. रद्द करने के लिए *stop reminders* भेजें.",
+        'reminder_none': "📅 अभी याद दिलाने के लिए प्रवेश की कोई आने वाली अंतिम तारीख नहीं है.",
+        'reminder_help': "⏰ मैं आपको याद दिला सकता हूँ. जैसे *कागल बस याद दिलाना* या *एडमिशन अंतिम तारीख याद दिलाना* भेजें.",
+        'reminder_stopped': "✅ आपके सभी रिमाइंडर रद्द कर दिए गए हैं.",
+        'reminder_bus': "⏰ *रिमाइंडर:* {route} बस {time} बजे छूटेगी, {lead} मिनट में.",
+        'reminder_admission': "⏰ *रिमाइंडर:* {requirement} - {details} (अंतिम तारीख {date}).",
+    },
+    'en': {
+        'language_set': "✅ I will reply to you in English from now on.",
+    },
+}
+
+# Labels used in the numbered menu, keyed by their English text
+MENU_LABELS = {
+    'Courses & Programs (UG, PG, Ph.D)': {'mr': 'अभ्यासक्रम (UG, PG, Ph.D)', 'hi': 'कोर्स (UG, PG, Ph.D)'},
+    'Specializations by Department': {'mr': 'विभागानुसार स्पेशलायझेशन', 'hi': 'विभाग अनुसार स्पेशलाइज़ेशन'},
+    'Facilities & Infrastructure': {'mr': 'सुविधा व पायाभूत सुविधा', 'hi': 'सुविधाएँ और इंफ्रास्ट्रक्चर'},
+    'Placements & Career': {'mr': 'प्लेसमेंट व करिअर', 'hi': 'प्लेसमेंट और करियर'},
+    'College Information': {'mr': 'कॉलेजची माहिती', 'hi': 'कॉलेज की जानकारी'},
+    'Rankings & Accreditations': {'mr': 'रँकिंग व मानांकन', 'hi': 'रैंकिंग और मान्यता'},
+    'Bus Routes & Transport': {'mr': 'बस मार्ग व वाहतूक', 'hi': 'बस रूट और परिवहन'},
+    'Admission Requirements': {'mr': 'प्रवेश पात्रता', 'hi': 'प्रवेश आवश्यकताएँ'},
+    'Faculty Achievements': {'mr': 'प्राध्यापकांची कामगिरी', 'hi': 'फैकल्टी उपलब्धियाँ'},
+    'Student Achievements': {'mr': 'विद्यार्थ्यांची कामगिरी', 'hi': 'छात्र उपलब्धियाँ'},
+    'Undergraduate (B.Tech/B.Arch)': {'mr': 'पदवी (B.Tech/B.Arch)', 'hi': 'स्नातक (B.Tech/B.Arch)'},
+    'Postgraduate (M.Tech)': {'mr': 'पदव्युत्तर (M.Tech)', 'hi': 'स्नातकोत्तर (M.Tech)'},
+    'Doctorate (Ph.D)': {'mr': 'डॉक्टरेट (Ph.D)', 'hi': 'डॉक्टरेट (Ph.D)'},
+    'Labs': {'mr': 'प्रयोगशाळा', 'hi': 'प्रयोगशालाएँ'},
+    'Infrastructure': {'mr': 'पायाभूत सुविधा', 'hi': 'इंफ्रास्ट्रक्चर'},
+    'Transportation': {'mr': 'वाहतूक', 'hi': 'परिवहन'},
+    'Scholarships': {'mr': 'शिष्यवृत्ती', 'hi': 'छात्रवृत्ति'},
+    'Top recruiters by package': {'mr': 'सर्वाधिक पॅकेज देणाऱ्या कंपन्या', 'hi': 'सबसे ज़्यादा पैकेज देने वाली कंपनियाँ'},
+    'Reply with a number for more:': {'mr': 'अधिक माहितीसाठी क्रमांक पाठवा:', 'hi': 'और जानकारी के लिए नंबर भेजें:'},
+    'Main menu': {'mr': 'मुख्य मेनू', 'hi': 'मुख्य मेनू'},
+}
+
+DIGIT_TRANSLATION = str.maketrans(DEVANAGARI_DIGITS)
+
+def strip_emoji(text):
+    """Remove emoji and pictographic symbols from text"""
+    return ''.join(
+        c for c in text
+        if c not in EMOJI_JOINERS and unicodedata.category(c) not in ('So', 'Sk', 'Cs')
+    )
+
+def transliterate_devanagari(text):
+    """Transliterate Devanagari text to lowercase Latin"""
+    out = []
+    pending_vowel = False
+    for c in text:
+        if c in DEVANAGARI_CONSONANTS:
+            if pending_vowel:
+                out.append('a')
+            out.append(DEVANAGARI_CONSONANTS[c])
+            pending_vowel = True
+            continue
+        if c == DEVANAGARI_NUKTA:
+            continue
+        if c == DEVANAGARI_VIRAMA:
+            pending_vowel = False
+            continue
+        if c in DEVANAGARI_MATRAS:
+            out.append(DEVANAGARI_MATRAS[c])
+            pending_vowel = False
+            continue
+        # Word boundaries drop the final inherent vowel (schwa deletion)
+        if pending_vowel and c in DEVANAGARI_SIGNS:
+            out.append('a')
+        pending_vowel = False
+        if c in DEVANAGARI_SIGNS:
+            out.append(DEVANAGARI_SIGNS[c])
+        elif c in DEVANAGARI_VOWELS:
+            out.append(DEVANAGARI_VOWELS[c])
+        elif c in DEVANAGARI_DIGITS:
+            out.append(DEVANAGARI_DIGITS[c])
+        else:
+            out.append(c)
+    return ''.join(out)
+
+def fold_vowels(text):
+    """Collapse long-vowel spellings so transliterations match Latin names"""
+    return text.replace('aa', 'a').replace('ee', 'i').replace('oo', 'u')
+
+def spelling_key(text):
+    """Loose spelling of a name that ignores the inherent 'a' kept by transliteration
+    
+    'sangali' and 'Sangli', 'ichalakaranji' and 'Ichalkaranji', 'uchagav' and 'Uchgaon'
+    all get the same key.
+    """
+    text = fold_vowels(text.lower()).replace('ph', 'f').replace('w', 'v')
+    text = re.sub(r'aon\b', 'av', text)
+    # 'City' is written सिटी
+    text = re.sub(r'y\b', 'i', re.sub(r'c(?=[iey])', 's', text))
+    # Every 'a' except a word's first letter
+    return re.sub(r'\Ba', '', text)
+
+def has_devanagari(text):
+    """True if text contains any Devanagari character"""
+    return any('\u0900' <= c <= '\u097f' for c in text)
+
+def tokenize(text):
+    """Split text into Latin/Devanagari word tokens"""
+    return TOKEN_PATTERN.findall(text)
+
+def detect_language(tokens, devanagari):
+    """Detect mr/hi/en from marker words, or None when there is no signal"""
+    scores = {lang: sum(token in markers for token in tokens) for lang, markers in LANGUAGE_MARKERS.items()}
+    best = max(scores, key=scores.get)
+    if scores[best]:
+        if scores['mr'] == scores['hi']:
+            return 'mr'
+        return best
+    if devanagari:
+        return 'mr'
+    # Latin words without Marathi/Hindi markers are English; digits and punctuation carry no signal
+    if any(token.isascii() and not token.isdigit() for token in tokens):
+        return 'en'
+    return None
+
+@lru_cache(maxsize=4096)
+def normalize_message(message):
+    """Normalize an incoming message for routing (NFC, emoji stripping, transliteration)"""
+    text = ' '.join(strip_emoji(unicodedata.normalize('NFC', message)).lower().split())
+    devanagari = has_devanagari(text)
+    transliterated = transliterate_devanagari(text) if devanagari else ''
+
+    tokens = tokenize(text) + tokenize(transliterated)
+    language = detect_language(tokens, devanagari)
+
+    # Append the English router keywords for any localized words
+    keywords = []
+    for table in LOCALIZED_KEYWORDS.values():
+        for token in tokens:
+            keyword = table.get(token)
+            if keyword and keyword not in keywords:
+                keywords.append(keyword)
+    routed = ' '.join([text] + keywords)
+
+    search_text = routed
+    if transliterated:
+        search_text = f"{routed} {fold_vowels(transliterated)}"
+    return NormalizedMessage(routed, search_text, language)
+
+def language_command(message):
+    """Return the language code if the whole message is a language switch command"""
+    text = ' '.join(strip_emoji(unicodedata.normalize('NFC', message)).lower().split())
+    return LANGUAGE_COMMANDS.get(text)
+
+def localize_reply(reply, language, intent=None):
+    """Translate an English reply into language (done once, at catalog compile time)"""
+    if language == 'en':
+        return reply
+    fixed = LOCALIZED_REPLIES.get(language, {}).get(intent)
+    if fixed:
+        return fixed
+    for english, localized in REPLY_PHRASES.get(language, []):
+        reply = reply.replace(english, localized)
+    return reply
+
+def menu_label(label, language):
+    """Translate a menu label, falling back to the English (or data) text"""
+    return MENU_LABELS.get(label, {}).get(language, label)
+
+def menu_code(message):
+    """Normalize a quick-reply like ' 1.2 ', '१.२' or '7)' into a menu code"""
+    return message.strip().translate(DIGIT_TRANSLATION).rstrip('.)')
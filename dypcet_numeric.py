@@ -0,0 +1,137 @@
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+# DYPCET numeric values: typed parsing of packages, counts, fares and times, plus sorted indexes
+
+NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)?')
+TIME_PATTERN = re.compile(r'(\d{1,2})(?:[:.](\d{2}))?\s*(am|pm|a\.m\.|p\.m\.)?', re.IGNORECASE)
+DATE_PATTERN = re.compile(
+    r'(\d{1,2})(?:st|nd|rd|th)?\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?,?\s+(\d{4})',
+    re.IGNORECASE,
+)
+MONTHS = ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec')
+
+def is_missing(value):
+    """True for None, NaN and blank strings"""
+    return value is None or value != value or not str(value).strip()
+
+def parse_numeric_range(value):
+    """Parse '64 LPA', '4.5-3 LPA' or '554+' into (min, max) floats, or (None, None)"""
+    if is_missing(value):
+        return None, None
+    numbers = [float(n) for n in NUMBER_PATTERN.findall(str(value).replace(',', ''))]
+    if not numbers:
+        return None, None
+    return min(numbers), max(numbers)
+
+def parse_fare(value):
+    """Parse a fare like '15600' or '₹15,600' into an int, or None"""
+    if is_missing(value):
+        return None
+    numbers = NUMBER_PATTERN.findall(str(value).replace(',', ''))
+    return int(float(numbers[0])) if numbers else None
+
+def parse_time_minutes(value, default_meridiem='am'):
+    """Parse '7:55 AM' (or '7.55', '19:55') into minutes after midnight, or None"""
+    if is_missing(value):
+        return None
+    match = TIME_PATTERN.search(str(value))
+    if not match:
+        return None
+    hours = int(match.group(1))
+    minutes = int(match.group(2) or 0)
+    meridiem = (match.group(3) or '').lower().replace('.', '')
+    if hours > 23 or minutes > 59:
+        return None
+    # A bare 12 is noon, never midnight
+    if not meridiem and hours < 12:
+        meridiem = default_meridiem
+    if meridiem == 'pm' and hours < 12:
+        hours += 12
+    elif meridiem == 'am' and hours == 12:
+        hours = 0
+    return hours * 60 + minutes
+
+def parse_date(value):
+    """Parse the first date like '31st March 2025' in a value into a date, or None"""
+    if is_missing(value):
+        return None
+    match = DATE_PATTERN.search(str(value))
+    if not match:
+        return None
+    try:
+        return date(int(match.group(3)), MONTHS.index(match.group(2).lower()) + 1, int(match.group(1)))
+    except ValueError:
+        return None
+
+def format_minutes(minutes):
+    """Format minutes after midnight as '7:45 AM'"""
+    hours, mins = divmod(int(minutes), 60)
+    meridiem = 'AM' if hours < 12 else 'PM'
+    return f"{(hours % 12) or 12}:{mins:02d} {meridiem}"
+
+def format_number(value):
+    """Format a parsed number without a trailing '.0'"""
+    return f"{value:g}"
+
+# Typed columns added to tables at load time: source column -> (parser, derived columns)
+NUMERIC_COLUMNS = {
+    'placements': [('Value', parse_numeric_range, ('Value_Min', 'Value_Max'))],
+    'recruiters': [('Package', parse_numeric_range, ('Package_Min_LPA', 'Package_Max_LPA'))],
+    'bus_routes': [
+        ('Departure_Time', parse_time_minutes, ('Departure_Minutes',)),
+        ('Fare', parse_fare, ('Fare_Amount',)),
+    ],
+}
+
+def derived_columns(table):
+    """Names of the typed columns added to a table at load time"""
+    return [name for _, _, names in NUMERIC_COLUMNS.get(table, []) for name in names]
+
+def add_numeric_columns(table, df):
+    """Add typed numeric columns parsed from a table's raw string columns"""
+    for source, parser, names in NUMERIC_COLUMNS.get(table, []):
+        if source not in df.columns:
+            continue
+        parsed = [parser(value) for value in df[source]]
+        if len(names) == 1:
+            df[names[0]] = [float('nan') if p is None else p for p in parsed]
+        else:
+            for i, name in enumerate(names):
+                df[name] = [float('nan') if p[i] is None else p[i] for p in parsed]
+    return df
+
+class SortedIndex:
+    """Rows sorted by a numeric key, for logarithmic range and top-k queries"""
+
+    def __init__(self, items):
+        pairs = sorted(
+            ((key, position, value) for position, (key, value) in enumerate(items) if not is_missing(key)),
+            key=lambda pair: (pair[0], pair[1]),
+        )
+        self.keys = [pair[0] for pair in pairs]
+        self.values = [pair[2] for pair in pairs]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def range(self, low=None, high=None, include_low=True, include_high=True):
+        """Values with low <= key <= high (bounds optional, inclusivity configurable)"""
+        start = 0
+        end = len(self.keys)
+        if low is not None:
+            start = (bisect_left if include_low else bisect_right)(self.keys, low)
+        if high is not None:
+            end = (bisect_right if include_high else bisect_left)(self.keys, high)
+        return self.values[start:end]
+
+    def smallest(self, k):
+        """The k values with the smallest keys, ascending"""
+        return self.values[:max(k, 0)]
+
+    def largest(self, k):
+        """The k values with the largest keys, descending"""
+        if k <= 0:
+            return []
+        return self.values[-k:][::-1]
@@ -0,0 +1,160 @@
+import heapq
+import json
+import os
+import threading
+import time
+
+# DYPCET reminders: subscriptions bucketed by due time on a heap, persisted in an append-only journal
+
+class ReminderScheduler:
+    """Pending reminders keyed by due time, fired in batches by a background thread
+
+    Subscriptions are only ever written to the journal; the scheduler applies them
+    when it reads the journal back, so webhook workers in other processes can
+    subscribe by appending to the same file. Due times are recomputed from the data
+    by next_due(reminder, after), so reminders survive restarts and data edits.
+    """
+
+    def __init__(self, journal_path, next_due, deliver, poll_seconds=5.0):
+        self.journal_path = journal_path
+        self.next_due = next_due
+        self.deliver = deliver
+        self.poll_seconds = poll_seconds
+        self.reminders = {}
+        self.by_sender = {}
+        # One heap entry per distinct due time; reminders due together share a bucket
+        self._heap = []
+        self._buckets = {}
+        self._due = {}
+        self._offset = 0
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def __len__(self):
+        return len(self._due)
+
+    def add(self, reminder):
+        """Subscribe (or re-subscribe) a reminder; its 'id' identifies it"""
+        self._append({'op': 'add', 'reminder': reminder})
+
+    def remove_sender(self, sender):
+        """Cancel every reminder of a sender"""
+        self._append({'op': 'remove_sender', 'sender': sender})
+
+    def _append(self, record):
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write(line)
+        self._wake.set()
+
+    def sync(self, now=None):
+        """Apply journal records appended since the last sync"""
+        if not os.path.exists(self.journal_path):
+            return
+        now = time.time() if now is None else now
+        with self._lock:
+            with open(self.journal_path, 'rb') as f:
+                f.seek(self._offset)
+                chunk = f.read()
+            # A partially written last line is left for the next sync
+            end = chunk.rfind(b'\n') + 1
+            self._offset += end
+            for line in chunk[:end].splitlines():
+                try:
+                    self._apply(json.loads(line), now)
+                except (ValueError, KeyError) as e:
+                    print(f"❌ Skipping bad reminder journal line: {str(e)}")
+
+    def _apply(self, record, now):
+        if record['op'] == 'add':
+            reminder = record['reminder']
+            self._forget(reminder['id'])
+            self.reminders[reminder['id']] = reminder
+            self.by_sender.setdefault(reminder['sender'], set()).add(reminder['id'])
+            self._schedule(reminder, now)
+        elif record['op'] == 'remove_sender':
+            for reminder_id in list(self.by_sender.get(record['sender'], ())):
+                self._forget(reminder_id)
+
+    def _forget(self, reminder_id):
+        reminder = self.reminders.pop(reminder_id, None)
+        if reminder:
+            self.by_sender.get(reminder['sender'], set()).discard(reminder_id)
+            if not self.by_sender.get(reminder['sender']):
+                self.by_sender.pop(reminder['sender'], None)
+        # The bucket entry is left behind and skipped when its time comes
+        self._due.pop(reminder_id, None)
+
+    def _schedule(self, reminder, after):
+        due = self.next_due(reminder, after)
+        if due is None:
+            self._forget(reminder['id'])
+            return
+        self._due[reminder['id']] = due
+        bucket = self._buckets.get(due)
+        if bucket is None:
+            bucket = self._buckets[due] = set()
+            heapq.heappush(self._heap, due)
+        bucket.add(reminder['id'])
+
+    def compact(self):
+        """Rewrite the journal with one record per pending reminder"""
+        with self._lock:
+            tmp_path = f"{self.journal_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for reminder in self.reminders.values():
+                    f.write(json.dumps({'op': 'add', 'reminder': reminder}, ensure_ascii=False) + '\n')
+            os.replace(tmp_path, self.journal_path)
+            self._offset = os.path.getsize(self.journal_path)
+
+    def fire_due(self, now=None):
+        """Deliver every reminder due by now, one batch per due time; returns the number delivered"""
+        now = time.time() if now is None else now
+        batches = []
+        with self._lock:
+            while self._heap and self._heap[0] <= now:
+                due = heapq.heappop(self._heap)
+                batch = []
+                for reminder_id in self._buckets.pop(due, ()):
+                    if self._due.get(reminder_id) == due:
+                        del self._due[reminder_id]
+                        batch.append(self.reminders[reminder_id])
+                # Skip reminders whose time moved (e.g. a departure time was edited), then reschedule all
+                ready = [reminder for reminder in batch if self.next_due(reminder, due - 1) == due]
+                ready_ids = {reminder['id'] for reminder in ready}
+                for reminder in batch:
+                    self._schedule(reminder, max(now, due) if reminder['id'] in ready_ids else now)
+                if ready:
+                    batches.append(ready)
+
+        for batch in batches:
+            try:
+                self.deliver(batch)
+            except Exception as e:
+                print(f"❌ Error delivering {len(batch)} reminders: {str(e)}")
+        return sum(len(batch) for batch in batches)
+
+    def run(self):
+        """Scheduler loop: pick up new subscriptions and fire due reminders"""
+        while True:
+            self.sync()
+            self.fire_due()
+            with self._lock:
+                wait = self.poll_seconds
+                if self._heap:
+                    wait = min(wait, max(self._heap[0] - time.time(), 0))
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def start(self):
+        """Load the journal and start the scheduler thread (once per process)"""
+        with self._lock:
+            if self._thread is None:
+                # Compacting at startup drops reminders that have expired or lost their data row
+                self.sync()
+                if os.path.exists(self.journal_path):
+                    self.compact()
+                self._thread = threading.Thread(target=self.run, name='reminders', daemon=True)
+                self._thread.start()
+        return self._thread
@@ -0,0 +1,104 @@
+from string import Formatter
+
+from dypcet_numeric import is_missing
+
+# DYPCET reply templates: reply formats declared once, compiled into fragment lists and rendered with one join
+
+class Line:
+    """One reply fragment such as '   • *{Facility}*\\n', elided when a field it needs is missing"""
+
+    def __init__(self, fmt, required=None, unless_equal=None, skip_values=()):
+        # Literal text and field names alternate in the compiled fragment list
+        self.fragments = []
+        for literal, field, spec, conversion in Formatter().parse(fmt):
+            if spec or conversion:
+                raise ValueError(f"Format specs are not supported in templates: {fmt!r}")
+            if literal:
+                self.fragments.append((literal, None))
+            if field is not None:
+                self.fragments.append((None, field))
+        self.fields = [field for _, field in self.fragments if field is not None]
+        self.required = tuple(self.fields if required is None else required)
+        self.unless_equal = unless_equal
+        self.skip_values = frozenset(skip_values)
+
+    def render(self, row, out):
+        """Append the line's fragments to out; returns False (appending nothing) when elided"""
+        for field in self.required:
+            value = row.get(field)
+            if is_missing(value) or value in self.skip_values:
+                return False
+        if self.unless_equal and row.get(self.unless_equal[0]) == row.get(self.unless_equal[1]):
+            return False
+        for literal, field in self.fragments:
+            out.append(literal if field is None else str(row.get(field)))
+        return True
+
+class Row:
+    """A bullet line followed by detail lines that are only rendered with the bullet"""
+
+    def __init__(self, *lines):
+        self.lines = [line if isinstance(line, Line) else Line(line) for line in lines]
+        self.fields = list(dict.fromkeys(field for line in self.lines for field in line.fields))
+
+    def render(self, row, out):
+        """Append one row's lines to out; returns False when its bullet line is elided"""
+        first, *details = self.lines
+        if not first.render(row, out):
+            return False
+        for line in details:
+            line.render(row, out)
+        return True
+
+    def render_rows(self, rows, out):
+        """Append every row's lines to out"""
+        for row in rows:
+            self.render(row, out)
+
+class Groups:
+    """Rows grouped under a header line per group, each group followed by a blank line"""
+
+    def __init__(self, by, header, row, order=None, labels=None):
+        self.by = by
+        self.header = header if isinstance(header, Line) else Line(header)
+        self.row = row
+        # None keeps first-appearance order, 'sorted' sorts group names, a list fixes the order
+        self.order = order
+        self.labels = labels or {}
+        self.fields = [by] + [field for field in row.fields if field != by]
+
+    def render_rows(self, rows, out):
+        """Append the grouped rows to out"""
+        groups = {}
+        for row in rows:
+            key = row.get(self.by)
+            if not is_missing(key):
+                groups.setdefault(key, []).append(row)
+        if self.order == 'sorted':
+            keys = sorted(groups)
+        elif self.order is not None:
+            keys = [key for key in self.order if key in groups]
+        else:
+            keys = list(groups)
+        for key in keys:
+            self.header.render({'group': self.labels.get(key, key)}, out)
+            self.row.render_rows(groups[key], out)
+            out.append("\n")
+
+def table_rows(df, fields):
+    """Rows of a DataFrame as dicts of just the given columns (much cheaper than iterrows)"""
+    columns = [field for field in fields if field in df.columns]
+    return [dict(zip(columns, values)) for values in zip(*(df[column].tolist() for column in columns))]
+
+def render(*parts):
+    """Join literal strings and (Row or Groups, rows or DataFrame) pairs into a reply in one pass"""
+    out = []
+    for part in parts:
+        if isinstance(part, str):
+            out.append(part)
+            continue
+        block, rows = part
+        if hasattr(rows, 'columns'):
+            rows = table_rows(rows, block.fields)
+        block.render_rows(rows, out)
+    return ''.join(out)
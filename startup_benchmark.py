@@ -0,0 +1,68 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Startup-time benchmark: fails (exit code 1) when cold start exceeds its budget
+
+IMPORT_BUDGET_SECONDS = float(os.environ.get('IMPORT_BUDGET_SECONDS', '1.0'))
+STARTUP_BUDGET_SECONDS = float(os.environ.get('STARTUP_BUDGET_SECONDS', '5.0'))
+STARTUP_BENCHMARK_RUNS = int(os.environ.get('STARTUP_BENCHMARK_RUNS', '3'))
+
+# Runs in a fresh interpreter so every measurement is a real cold start
+PROBE = """
+import json, time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+app.start_warm_up().join()
+ready = time.perf_counter()
+client = app.app.test_client()
+status = client.get('/ready').status_code
+print(json.dumps({'import': imported - started, 'ready': ready - started, 'status': status}))
+"""
+
+def measure_cold_start():
+    """Measure import and import-to-ready time in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, '-c', PROBE],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        # Never send reminders or compact the shared journal from a benchmark run
+        env={**os.environ, 'REMINDER_SCHEDULER': '0'},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def run_benchmark():
+    """Run the startup benchmark and return True when within budget"""
+    runs = [measure_cold_start() for _ in range(STARTUP_BENCHMARK_RUNS)]
+    import_time = statistics.median(run['import'] for run in runs)
+    ready_time = statistics.median(run['ready'] for run in runs)
+
+    print("="*60)
+    print("DYPCET BOT STARTUP BENCHMARK")
+    print("="*60)
+    print(f"Runs: {len(runs)}")
+    print(f"Import time (median):          {import_time:.3f}s (budget {IMPORT_BUDGET_SECONDS:.3f}s)")
+    print(f"Import-to-ready time (median): {ready_time:.3f}s (budget {STARTUP_BUDGET_SECONDS:.3f}s)")
+
+    ok = True
+    if any(run['status'] != 200 for run in runs):
+        print("❌ /ready did not return 200 after warm-up")
+        ok = False
+    if import_time > IMPORT_BUDGET_SECONDS:
+        print("❌ Import time exceeds budget")
+        ok = False
+    if ready_time > STARTUP_BUDGET_SECONDS:
+        print("❌ Import-to-ready time exceeds budget")
+        ok = False
+    if ok:
+        print("✅ Startup within budget")
+    print("="*60)
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if run_benchmark() else 1)